@@ -1,3 +1,5 @@
+from collections import deque
+
 def calculate_need(max_matrix, allocation_matrix):
     need = []
     for i in range(len(max_matrix)):
@@ -49,6 +51,218 @@ def is_safe_state(processes, available, max_matrix, allocation_matrix):
             
     return True, safe_sequence
 
+def is_safe_state_event(processes, available, max_matrix, allocation_matrix):
+    """事件驱动的安全性检查：Work增加时只唤醒最后一个阻塞资源被满足的进程"""
+    n = len(processes)
+    m = len(available)
+
+    # 计算Need矩阵
+    need = calculate_need(max_matrix, allocation_matrix)
+
+    # 复制可用资源数组
+    work = available.copy()
+
+    # 每种资源一个按Need升序排列的进程队列，以及队列中已满足部分的位置
+    queues = [sorted(range(n), key=lambda x: (need[x][j], x)) for j in range(m)]
+    pointers = [0] * m
+
+    # 每个进程仍然不被满足的资源种类数
+    blocking = [m] * n
+    ready = deque(range(n)) if m == 0 else deque()
+    safe_sequence = []
+
+    def advance(j):
+        queue = queues[j]
+        k = pointers[j]
+        while k < n and need[queue[k]][j] <= work[j]:
+            p_idx = queue[k]
+            blocking[p_idx] -= 1
+            if blocking[p_idx] == 0:
+                ready.append(p_idx)
+            k += 1
+        pointers[j] = k
+
+    for j in range(m):
+        advance(j)
+
+    while ready:
+        p_idx = ready.popleft()
+        safe_sequence.append(p_idx)
+        # 归还资源，只推进Work发生变化的资源队列
+        for j in range(m):
+            if allocation_matrix[p_idx][j]:
+                work[j] += allocation_matrix[p_idx][j]
+                advance(j)
+
+    if len(safe_sequence) < n:
+        return False, []
+
+    return True, safe_sequence
+
+# 可选的安全性检查算法
+SAFETY_ALGORITHMS = {
+    "scan": is_safe_state,
+    "event": is_safe_state_event,
+}
+
+def run_safety_check(processes, available, max_matrix, allocation_matrix, algorithm="scan"):
+    if algorithm not in SAFETY_ALGORITHMS:
+        raise ValueError(f"未知的安全性检查算法：{algorithm}")
+    return SAFETY_ALGORITHMS[algorithm](processes, available, max_matrix, allocation_matrix)
+
+class BankerState:
+    """维护一份实时的银行家状态，支持增量的资源请求与释放"""
+
+    def __init__(self, available, max_matrix, allocation_matrix, algorithm="scan"):
+        self.n = len(max_matrix)
+        self.m = len(available)
+        self.available = list(available)
+        self.max_matrix = [list(row) for row in max_matrix]
+        self.allocation_matrix = [list(row) for row in allocation_matrix]
+        self.need = calculate_need(self.max_matrix, self.allocation_matrix)
+        self.algorithm = algorithm
+
+        # 缓存最近一次得到的安全序列，不安全时为None
+        safe, sequence = run_safety_check(list(range(self.n)), self.available,
+                                          self.max_matrix, self.allocation_matrix,
+                                          self.algorithm)
+        self.safe_sequence = sequence if safe else None
+
+        # 各进程的最大可安全请求量，状态发生变化时清空
+        self._grantable_cache = {}
+
+    def is_safe(self):
+        return self.safe_sequence is not None
+
+    def request(self, pid, vector):
+        """进程pid请求资源vector，安全则分配并返回(True, 安全序列)，否则状态不变并返回(False, [])"""
+        for j in range(self.m):
+            if vector[j] > self.need[pid][j]:
+                raise ValueError(f"P{pid}的请求超过了其声明的最大需求")
+        for j in range(self.m):
+            if vector[j] > self.available[j]:
+                return False, []
+
+        self._apply(pid, vector, 1)
+        sequence = self._verify({pid})
+        if sequence is None:
+            # 回滚试探性分配
+            self._apply(pid, vector, -1)
+            return False, []
+
+        self.safe_sequence = sequence
+        if any(vector):
+            self._grantable_cache.clear()
+        return True, sequence
+
+    def request_many(self, requests):
+        """把一批请求[(pid, vector), ...]作为整体试探分配，只做一次安全性验证，全部安全才分配"""
+        combined = {}
+        for pid, vector in requests:
+            row = combined.setdefault(pid, [0] * self.m)
+            for j in range(self.m):
+                row[j] += vector[j]
+        for pid, row in combined.items():
+            for j in range(self.m):
+                if row[j] > self.need[pid][j]:
+                    raise ValueError(f"P{pid}的请求超过了其声明的最大需求")
+        for j in range(self.m):
+            if sum(row[j] for row in combined.values()) > self.available[j]:
+                return False, []
+
+        for pid, row in combined.items():
+            self._apply(pid, row, 1)
+        sequence = self._verify(combined)
+        if sequence is None:
+            for pid, row in combined.items():
+                self._apply(pid, row, -1)
+            return False, []
+
+        self.safe_sequence = sequence
+        if any(any(row) for row in combined.values()):
+            self._grantable_cache.clear()
+        return True, sequence
+
+    def release(self, pid, vector):
+        """进程pid释放资源vector"""
+        for j in range(self.m):
+            if vector[j] > self.allocation_matrix[pid][j]:
+                raise ValueError(f"P{pid}释放的资源超过了其已分配的资源")
+        # 释放不会破坏已缓存的安全序列：pid之前的进程可用资源只增不减，
+        # pid完成后归还的资源总量不变，因此无需重新检查
+        self._apply(pid, vector, -1)
+        if any(vector):
+            self._grantable_cache.clear()
+            if self.safe_sequence is None:
+                # 原本不安全的状态在释放后可能变为安全
+                safe, sequence = run_safety_check(list(range(self.n)), self.available,
+                                                  self.max_matrix, self.allocation_matrix,
+                                                  self.algorithm)
+                self.safe_sequence = sequence if safe else None
+        return True, self.safe_sequence
+
+    def max_grantable(self, pid):
+        """P{pid}对每类资源单独发出请求时，仍能保持安全状态的最大请求量"""
+        if pid not in self._grantable_cache:
+            self._grantable_cache[pid] = [self._max_single_request(pid, j) for j in range(self.m)]
+        return self._grantable_cache[pid]
+
+    def _max_single_request(self, pid, j):
+        if self.safe_sequence is None:
+            return 0
+
+        # 能满足的请求量越小越安全，因此可以对请求量二分查找
+        vector = [0] * self.m
+        low, high = 0, min(self.need[pid][j], self.available[j])
+        while low < high:
+            mid = (low + high + 1) // 2
+            vector[j] = mid
+            self._apply(pid, vector, 1)
+            safe = self._verify({pid}) is not None
+            self._apply(pid, vector, -1)
+            if safe:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def _apply(self, pid, vector, sign):
+        for j in range(self.m):
+            delta = sign * vector[j]
+            self.available[j] -= delta
+            self.allocation_matrix[pid][j] += delta
+            self.need[pid][j] -= delta
+
+    def _verify(self, pids):
+        """在试探性分配给pids之后验证安全性，优先复用缓存的安全序列"""
+        sequence = self.safe_sequence
+        if sequence is not None:
+            # 分配只让这些进程之前的进程看到的Work变小，它们全部完成后的Work保持不变，
+            # 所以只需重新检查序列中最后一个被分配进程及其之前的部分
+            remaining = set(pids)
+            work = self.available.copy()
+            valid = True
+            for p_idx in sequence:
+                need_row = self.need[p_idx]
+                for j in range(self.m):
+                    if need_row[j] > work[j]:
+                        valid = False
+                        break
+                remaining.discard(p_idx)
+                if not valid or not remaining:
+                    break
+                alloc_row = self.allocation_matrix[p_idx]
+                for j in range(self.m):
+                    work[j] += alloc_row[j]
+            if valid:
+                return sequence
+
+        # 缓存序列失效时退回完整的安全性检查
+        safe, new_sequence = run_safety_check(list(range(self.n)), self.available,
+                                              self.max_matrix, self.allocation_matrix,
+                                              self.algorithm)
+        return new_sequence if safe else None
+
 # 测试数据
 processes = [0, 1, 2, 3, 4]
 available = [3, 3, 2]
@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from banker import calculate_need, run_safety_check
+
+# 工作进程中的基准状态，由进程池初始化时传入一次
+_base_state = None
+
+
+def _init_worker(available, max_matrix, allocation_matrix, algorithm):
+    global _base_state
+    _base_state = (available, max_matrix, allocation_matrix, algorithm)
+
+
+def _evaluate(candidate):
+    """在基准状态上试探性地满足一个请求并检查安全性"""
+    pid, vector = candidate
+    available, max_matrix, allocation_matrix, algorithm = _base_state
+
+    new_available = [available[j] - vector[j] for j in range(len(available))]
+    # 只复制被修改的那一行，其余行与基准状态共享
+    new_allocation = list(allocation_matrix)
+    new_allocation[pid] = [allocation_matrix[pid][j] + vector[j] for j in range(len(available))]
+
+    return run_safety_check(list(range(len(max_matrix))), new_available,
+                            max_matrix, new_allocation, algorithm)
+
+
+def evaluate_requests(available, max_matrix, allocation_matrix, candidates,
+                      algorithm="scan", max_workers=None):
+    """批量评估候选请求[(pid, vector), ...]，按顺序返回每个请求的(是否安全, 安全序列)"""
+    need = calculate_need(max_matrix, allocation_matrix)
+    m = len(available)
+    results = [None] * len(candidates)
+
+    # 先做廉价的 Request <= Need 和 Request <= Available 检查，不通过的直接判定
+    pending = []
+    for k, (pid, vector) in enumerate(candidates):
+        if any(vector[j] > need[pid][j] or vector[j] > available[j] for j in range(m)):
+            results[k] = (False, [])
+        else:
+            pending.append(k)
+
+    if not pending:
+        return results
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(pending) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(available, max_matrix, allocation_matrix, algorithm)) as executor:
+        verdicts = executor.map(_evaluate, [candidates[k] for k in pending], chunksize=chunksize)
+        for k, verdict in zip(pending, verdicts):
+            results[k] = verdict
+
+    return results
@@ -0,0 +1,107 @@
+import sys
+
+# 二进制状态文件：int32的n、m文件头，随后依次是Max(n*m)、Allocation(n*m)、Available(m)，小端序。
+# 只有二进制格式用到NumPy，在用到时才导入，文本格式的读写不依赖它
+STATE_DTYPE = '<i4'
+HEADER_SIZE = 2 * 4
+
+
+def read_text_state(filename):
+    """读取banker_data.txt格式的文本状态，返回(available, max_matrix, allocation_matrix)
+
+    缺失的行或数值（例如留空的可用资源）按0处理。
+    """
+    with open(filename, 'r', encoding='utf-8') as file:
+        lines = [line.strip() for line in file if line.strip() and not line.startswith('#')]
+    if not lines:
+        raise ValueError("文本状态文件缺少进程数和资源类型数")
+
+    n, m = map(int, lines[0].split())
+
+    def read_row(index):
+        values = lines[index].split() if index < len(lines) else []
+        row = [int(v) for v in values[:m]]
+        return row + [0] * (m - len(row))
+
+    max_matrix = [read_row(1 + i) for i in range(n)]
+    allocation_matrix = [read_row(1 + n + i) for i in range(n)]
+    available = read_row(1 + 2 * n)
+    return available, max_matrix, allocation_matrix
+
+
+def write_text_state(filename, available, max_matrix, allocation_matrix):
+    """写出banker_data.txt格式的文本状态"""
+    n, m = len(max_matrix), len(available)
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(f"# 进程数 资源类型数\n{n} {m}\n\n")
+        file.write("# 最大需求矩阵 (Max)\n")
+        for row in max_matrix:
+            file.write(" ".join(str(v) for v in row) + "\n")
+        file.write("\n# 当前分配矩阵 (Allocation)\n")
+        for row in allocation_matrix:
+            file.write(" ".join(str(v) for v in row) + "\n")
+        file.write("\n# 可用资源 (Available)\n")
+        file.write(" ".join(str(v) for v in available) + "\n")
+
+
+def save_binary(filename, available, max_matrix, allocation_matrix):
+    import numpy as np
+    m = len(available)
+    max_matrix = np.asarray(max_matrix, dtype=STATE_DTYPE).reshape(-1, m)
+    allocation_matrix = np.asarray(allocation_matrix, dtype=STATE_DTYPE).reshape(-1, m)
+    n = max_matrix.shape[0]
+    with open(filename, 'wb') as file:
+        np.array([n, m], dtype=STATE_DTYPE).tofile(file)
+        max_matrix.tofile(file)
+        allocation_matrix.tofile(file)
+        np.asarray(available, dtype=STATE_DTYPE).tofile(file)
+
+
+def load_binary(filename):
+    """以内存映射方式打开二进制状态文件，返回(available, max_matrix, allocation_matrix)数组视图"""
+    import numpy as np
+    n, m = (int(v) for v in np.fromfile(filename, dtype=STATE_DTYPE, count=2))
+    data = np.memmap(filename, dtype=STATE_DTYPE, mode='r', offset=HEADER_SIZE,
+                     shape=(2 * n * m + m,))
+    max_matrix = data[:n * m].reshape(n, m)
+    allocation_matrix = data[n * m:2 * n * m].reshape(n, m)
+    available = data[2 * n * m:]
+    return available, max_matrix, allocation_matrix
+
+
+def check_binary(filename):
+    """直接对二进制状态文件做安全性检查"""
+    from banker_vectorized import is_safe_state_vectorized
+    return is_safe_state_vectorized(*load_binary(filename))
+
+
+def text_to_binary(text_filename, binary_filename):
+    save_binary(binary_filename, *read_text_state(text_filename))
+
+
+def binary_to_text(binary_filename, text_filename):
+    available, max_matrix, allocation_matrix = load_binary(binary_filename)
+    write_text_state(text_filename, available.tolist(), max_matrix.tolist(), allocation_matrix.tolist())
+
+
+def main(argv):
+    if len(argv) == 3 and argv[0] == "to-bin":
+        text_to_binary(argv[1], argv[2])
+    elif len(argv) == 3 and argv[0] == "to-text":
+        binary_to_text(argv[1], argv[2])
+    elif len(argv) == 2 and argv[0] == "check":
+        is_safe, sequence = check_binary(argv[1])
+        if is_safe:
+            print("系统处于安全状态，安全序列为：" + " -> ".join(f"P{i}" for i in sequence))
+        else:
+            print("系统处于不安全状态，没有安全序列！")
+    else:
+        print("用法：python banker_binary.py to-bin 文本文件 二进制文件\n"
+              "      python banker_binary.py to-text 二进制文件 文本文件\n"
+              "      python banker_binary.py check 二进制文件")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
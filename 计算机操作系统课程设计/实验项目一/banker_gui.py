@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from banker import is_safe_state
+from banker import run_safety_check
+from banker_binary import read_text_state, write_text_state
 
 class BankerGUI:
     def __init__(self, root):
@@ -20,6 +21,18 @@ class BankerGUI:
         self.n_processes = 5
         self.n_resources = 3
         
+        # 界面只负责显示，数据保存在这些矩阵中
+        self.max_matrix = [[0] * self.n_resources for _ in range(self.n_processes)]
+        self.allocation_matrix = [[0] * self.n_resources for _ in range(self.n_processes)]
+        self.available = [0] * self.n_resources
+        
+        # 正在编辑的单元格输入框
+        self.cell_editor = None
+        
+        # 安全性检查算法（显示名称 -> banker.SAFETY_ALGORITHMS中的键）
+        self.safety_algorithms = {"逐轮扫描": "scan", "事件驱动": "event"}
+        self.algorithm_var = tk.StringVar(value="逐轮扫描")
+        
         # 设置样式
         self.style = ttk.Style()
         self.style.configure('Title.TLabel', font=('Microsoft YaHei UI', 16, 'bold'))
@@ -50,175 +63,179 @@ class BankerGUI:
         ttk.Button(button_frame, text="加载数据", command=lambda: self.load_from_file(), width=10).pack(side="right", padx=2)
         ttk.Button(button_frame, text="保存数据", command=self.save_to_file, width=10).pack(side="right", padx=2)
         
-        # 矩阵区域
-        matrices_frame = ttk.Frame(main_frame)
-        matrices_frame.pack(fill="both", expand=True, pady=10)
-        
-        # 最大需求矩阵
-        max_frame = ttk.LabelFrame(matrices_frame, text="最大需求矩阵", padding=(5,5,5,5))
-        max_frame.pack(side="left", fill="both", expand=True, padx=5)
-        
-        # 分配矩阵
-        alloc_frame = ttk.LabelFrame(matrices_frame, text="分配矩阵", padding=(5,5,5,5))
-        alloc_frame.pack(side="right", fill="both", expand=True, padx=5)
+        # 矩阵区域：Treeview只绘制可见的行，双击单元格进行编辑
+        matrices_frame = ttk.LabelFrame(main_frame, text="最大需求矩阵 / 分配矩阵", padding=(5,5,5,5))
+        matrices_frame.pack(fill="both", expand=True, padx=5, pady=10)
         
-        # 创建矩阵输入框
-        self.max_entries = self.create_matrix(max_frame)
-        self.allocation_entries = self.create_matrix(alloc_frame)
+        self.matrix_tree = ttk.Treeview(matrices_frame, show='headings', height=6)
+        y_scroll = ttk.Scrollbar(matrices_frame, orient="vertical", command=self.matrix_tree.yview)
+        x_scroll = ttk.Scrollbar(matrices_frame, orient="horizontal", command=self.matrix_tree.xview)
+        self.matrix_tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        y_scroll.pack(side="right", fill="y")
+        x_scroll.pack(side="bottom", fill="x")
+        self.matrix_tree.pack(side="left", fill="both", expand=True)
+        self.matrix_tree.bind("<Double-1>", self.begin_cell_edit)
         
         # 可用资源区域
         available_frame = ttk.LabelFrame(main_frame, text="可用资源", padding=(5,5,5,5))
         available_frame.pack(fill="x", padx=5, pady=5)
         
-        self.available_entries = []
-        for j in range(self.n_resources):
-            ttk.Label(available_frame, text=chr(65+j), style='Matrix.TLabel').grid(row=0, column=j*2, padx=5)
-            entry = ttk.Entry(available_frame, width=5, justify='center', style='Matrix.TEntry')
-            entry.grid(row=0, column=j*2+1, padx=5, pady=5)
-            self.available_entries.append(entry)
+        self.available_tree = ttk.Treeview(available_frame, show='headings', height=1)
+        self.available_tree.pack(fill="x")
+        self.available_tree.bind("<Double-1>", self.begin_cell_edit)
         
-        # 检查按钮
-        ttk.Button(main_frame, text="检查安全状态", command=self.check_safety, width=15).pack(pady=5)
+        # 算法选择和检查按钮
+        check_frame = ttk.Frame(main_frame)
+        check_frame.pack(pady=5)
+        ttk.Combobox(check_frame, textvariable=self.algorithm_var, values=list(self.safety_algorithms),
+                     state="readonly", width=10).pack(side="left", padx=2)
+        ttk.Button(check_frame, text="检查安全状态", command=self.check_safety, width=15).pack(side="left", padx=2)
         
         # 结果显示
         self.result_text = tk.Text(main_frame, height=3, width=40, font=('Microsoft YaHei UI', 10))
         self.result_text.pack(pady=5)
+        
+        self.refresh_tables()
 
-    def create_matrix(self, parent):
-        entries = []
-        # 添加资源标签 (A, B, C)
-        for j in range(self.n_resources):
-            ttk.Label(parent, text=chr(65+j), style='Matrix.TLabel').grid(row=0, column=j+1, padx=5)
+    def configure_columns(self):
+        """根据资源类型数设置两个表格的列"""
+        names = [chr(65+j) for j in range(self.n_resources)]
+        matrix_columns = ["进程"] + [f"Max {name}" for name in names] + [f"Alloc {name}" for name in names]
+        self.matrix_tree.configure(columns=matrix_columns)
+        for col in matrix_columns:
+            self.matrix_tree.heading(col, text=col)
+            self.matrix_tree.column(col, width=55, minwidth=40, anchor="center", stretch=False)
         
-        # 添加进程标签和输入框
+        self.available_tree.configure(columns=names)
+        for col in names:
+            self.available_tree.heading(col, text=col)
+            self.available_tree.column(col, width=55, minwidth=40, anchor="center", stretch=False)
+
+    def row_values(self, i):
+        return [f"P{i}"] + self.max_matrix[i] + self.allocation_matrix[i]
+
+    def refresh_tables(self):
+        """按当前数据重新填充表格，只在进程数或资源数整体变化时使用"""
+        self.cancel_cell_edit()
+        self.configure_columns()
+        self.matrix_tree.delete(*self.matrix_tree.get_children())
         for i in range(self.n_processes):
-            ttk.Label(parent, text=f"P{i}", style='Matrix.TLabel').grid(row=i+1, column=0, padx=5)
-            row_entries = []
-            for j in range(self.n_resources):
-                entry = ttk.Entry(parent, width=5, justify='center', style='Matrix.TEntry')
-                entry.grid(row=i+1, column=j+1, padx=5, pady=2)
-                row_entries.append(entry)
-            entries.append(row_entries)
-        return entries
+            self.matrix_tree.insert('', tk.END, iid=str(i), values=self.row_values(i))
+        self.available_tree.delete(*self.available_tree.get_children())
+        self.available_tree.insert('', tk.END, iid="available", values=self.available)
+
+    def begin_cell_edit(self, event):
+        """在双击的单元格上放置输入框进行编辑"""
+        tree = event.widget
+        item = tree.identify_row(event.y)
+        column = tree.identify_column(event.x)
+        if not item or not column:
+            return
+        col_index = int(column[1:]) - 1
+        if tree is self.matrix_tree and col_index == 0:
+            return
+        
+        self.cancel_cell_edit()
+        bbox = tree.bbox(item, column)
+        if not bbox:
+            # 单元格不在可见区域内
+            return
+        x, y, width, height = bbox
+        editor = ttk.Entry(tree, justify='center', style='Matrix.TEntry')
+        editor.insert(0, tree.set(item, column))
+        editor.select_range(0, tk.END)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        editor.bind("<Return>", lambda e: self.commit_cell_edit(editor, tree, item, col_index))
+        editor.bind("<FocusOut>", lambda e: self.commit_cell_edit(editor, tree, item, col_index))
+        editor.bind("<Escape>", lambda e: self.cancel_cell_edit())
+        self.cell_editor = editor
+
+    def commit_cell_edit(self, editor, tree, item, col_index):
+        # 输入框已被取消或替换时忽略
+        if editor is not self.cell_editor:
+            return
+        try:
+            value = int(editor.get())
+        except ValueError:
+            self.cancel_cell_edit()
+            messagebox.showerror("错误", "请输入有效的数字！")
+            return
+        self.cancel_cell_edit()
+        
+        # 更新数据，再只刷新这一个单元格
+        if tree is self.available_tree:
+            self.available[col_index] = value
+        else:
+            i = int(item)
+            if col_index <= self.n_resources:
+                self.max_matrix[i][col_index - 1] = value
+            else:
+                self.allocation_matrix[i][col_index - 1 - self.n_resources] = value
+        tree.set(item, tree["columns"][col_index], value)
+
+    def cancel_cell_edit(self):
+        if self.cell_editor is not None:
+            editor = self.cell_editor
+            self.cell_editor = None
+            editor.destroy()
 
     def add_process(self):
         """添加一个新进程"""
+        self.cancel_cell_edit()
+        # 新进程的数据初始化为0，只插入这一行
+        self.max_matrix.append([0] * self.n_resources)
+        self.allocation_matrix.append([0] * self.n_resources)
+        self.matrix_tree.insert('', tk.END, iid=str(self.n_processes), values=self.row_values(self.n_processes))
         self.n_processes += 1
-        # 保存当前数据
-        max_data = self.get_matrix_data(self.max_entries)
-        alloc_data = self.get_matrix_data(self.allocation_entries)
-        avail_data = self.get_available_data()
-        
-        # 重新创建整个界面
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.create_widgets()
-        
-        # 恢复原有数据
-        if max_data and alloc_data and avail_data:
-            # 填充原有进程的数据
-            for i in range(len(max_data)):
-                for j in range(self.n_resources):
-                    self.max_entries[i][j].insert(0, str(max_data[i][j]))
-                    self.allocation_entries[i][j].insert(0, str(alloc_data[i][j]))
-            
-            # 新进程的数据初始化为0
-            for j in range(self.n_resources):
-                self.max_entries[-1][j].insert(0, "0")
-                self.allocation_entries[-1][j].insert(0, "0")
-            
-            # 恢复可用资源数据
-            for j in range(self.n_resources):
-                self.available_entries[j].insert(0, str(avail_data[j]))
 
     def delete_process(self):
         """删除最后一个进程"""
         if self.n_processes > 1:
-            # 保存当前数据（除了最后一个进程）
-            max_data = self.get_matrix_data(self.max_entries[:-1])
-            alloc_data = self.get_matrix_data(self.allocation_entries[:-1])
-            avail_data = self.get_available_data()
-            
+            self.cancel_cell_edit()
             self.n_processes -= 1
-            # 重新创建整个界面
-            for widget in self.root.winfo_children():
-                widget.destroy()
-            self.create_widgets()
-            
-            # 恢复数据
-            if max_data and alloc_data and avail_data:
-                for i in range(self.n_processes):
-                    for j in range(self.n_resources):
-                        self.max_entries[i][j].insert(0, str(max_data[i][j]))
-                        self.allocation_entries[i][j].insert(0, str(alloc_data[i][j]))
-                
-                for j in range(self.n_resources):
-                    self.available_entries[j].insert(0, str(avail_data[j]))
+            self.max_matrix.pop()
+            self.allocation_matrix.pop()
+            self.matrix_tree.delete(str(self.n_processes))
         else:
             messagebox.showwarning("警告", "至少需要保留一个进程！")
 
-    def clear_all_entries(self):
-        """清空所有输入框"""
-        for matrix in [self.max_entries, self.allocation_entries]:
-            for row in matrix:
-                for entry in row:
-                    entry.delete(0, tk.END)
-        
-        for entry in self.available_entries:
-            entry.delete(0, tk.END)
+    def set_state(self, available, max_matrix, allocation_matrix):
+        """替换全部数据并刷新表格"""
+        self.n_processes = len(max_matrix)
+        self.n_resources = len(available)
+        self.available = list(available)
+        self.max_matrix = [list(row) for row in max_matrix]
+        self.allocation_matrix = [list(row) for row in allocation_matrix]
+        self.refresh_tables()
 
     def load_from_file(self, filename=None):
         """从文件加载数据"""
         if filename is None:
             filename = filedialog.askopenfilename(
                 title="选择数据文件",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+                filetypes=[("Text files", "*.txt"), ("Binary state files", "*.bin"), ("All files", "*.*")]
             )
         if not filename:
             return
-            
+        
+        if filename.endswith('.bin'):
+            self.load_from_binary(filename)
+            return
+        
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                lines = [line.strip() for line in file if line.strip() and not line.startswith('#')]
-                
-                # 读取进程数和资源数
-                n_proc, n_res = map(int, lines[0].split())
-                if n_proc != self.n_processes or n_res != self.n_resources:
-                    self.n_processes = n_proc
-                    self.n_resources = n_res
-                    # 重新创建整个界面
-                    for widget in self.root.winfo_children():
-                        widget.destroy()
-                    self.create_widgets()
-                
-                # 清空现有数据
-                self.clear_all_entries()
-                
-                # 读取最大需求矩阵
-                current_line = 1
-                for i in range(self.n_processes):
-                    if current_line + i >= len(lines):
-                        break
-                    values = lines[current_line + i].split()
-                    for j in range(min(self.n_resources, len(values))):
-                        self.max_entries[i][j].insert(0, values[j])
-                
-                # 读取分配矩阵
-                current_line += self.n_processes
-                for i in range(self.n_processes):
-                    if current_line + i >= len(lines):
-                        break
-                    values = lines[current_line + i].split()
-                    for j in range(min(self.n_resources, len(values))):
-                        self.allocation_entries[i][j].insert(0, values[j])
-                
-                # 读取可用资源
-                current_line += self.n_processes
-                if current_line < len(lines):
-                    values = lines[current_line].split()
-                    for j in range(min(self.n_resources, len(values))):
-                        self.available_entries[j].insert(0, values[j])
-                
+            self.set_state(*read_text_state(filename))
+        
+        except Exception as e:
+            messagebox.showerror("错误", f"加载文件时出错：{str(e)}")
+
+    def load_from_binary(self, filename):
+        """从二进制状态文件加载数据"""
+        try:
+            # 二进制格式需要NumPy，只在打开这种文件时才导入
+            from banker_binary import load_binary
+            available, max_matrix, allocation_matrix = load_binary(filename)
+            self.set_state(available.tolist(), max_matrix.tolist(), allocation_matrix.tolist())
         except Exception as e:
             messagebox.showerror("错误", f"加载文件时出错：{str(e)}")
 
@@ -231,71 +248,19 @@ class BankerGUI:
         )
         if not filename:
             return
-            
+        
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
-                # 写入进程数和资源数
-                file.write(f"# 进程数 资源类型数\n{self.n_processes} {self.n_resources}\n\n")
-                
-                # 写入最大需求矩阵
-                file.write("# 最大需求矩阵 (Max)\n")
-                for row in self.max_entries:
-                    values = [entry.get() for entry in row]
-                    file.write(" ".join(values) + "\n")
-                file.write("\n")
-                
-                # 写入分配矩阵
-                file.write("# 当前分配矩阵 (Allocation)\n")
-                for row in self.allocation_entries:
-                    values = [entry.get() for entry in row]
-                    file.write(" ".join(values) + "\n")
-                file.write("\n")
-                
-                # 写入可用资源
-                file.write("# 可用资源 (Available)\n")
-                values = [entry.get() for entry in self.available_entries]
-                file.write(" ".join(values) + "\n")
-                
-                messagebox.showinfo("成功", "数据保存成功！")
-                
+            write_text_state(filename, self.available, self.max_matrix, self.allocation_matrix)
+            messagebox.showinfo("成功", "数据保存成功！")
+        
         except Exception as e:
             messagebox.showerror("错误", f"保存文件时出错：{str(e)}")
 
-    def get_matrix_data(self, entries):
-        matrix = []
-        for row in entries:
-            matrix_row = []
-            for entry in row:
-                try:
-                    value = int(entry.get())
-                    matrix_row.append(value)
-                except ValueError:
-                    messagebox.showerror("错误", "请输入有效的数字！")
-                    return None
-            matrix.append(matrix_row)
-        return matrix
-
-    def get_available_data(self):
-        available = []
-        for entry in self.available_entries:
-            try:
-                value = int(entry.get())
-                available.append(value)
-            except ValueError:
-                messagebox.showerror("错误", "请输入有效的数字！")
-                return None
-        return available
-
     def check_safety(self):
-        max_matrix = self.get_matrix_data(self.max_entries)
-        allocation_matrix = self.get_matrix_data(self.allocation_entries)
-        available = self.get_available_data()
-        
-        if None in (max_matrix, allocation_matrix, available):
-            return
-            
         processes = list(range(self.n_processes))
-        is_safe, sequence = is_safe_state(processes, available, max_matrix, allocation_matrix)
+        algorithm = self.safety_algorithms[self.algorithm_var.get()]
+        is_safe, sequence = run_safety_check(processes, self.available, self.max_matrix,
+                                             self.allocation_matrix, algorithm)
         
         self.result_text.delete(1.0, tk.END)
         if is_safe:
@@ -307,4 +272,4 @@ class BankerGUI:
 if __name__ == "__main__":
     root = tk.Tk()
     app = BankerGUI(root)
-    root.mainloop() 
\ No newline at end of file
+    root.mainloop()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def run_client(pid, n_resources, max_claim, deadline, latencies, connect):
+    """模拟一个进程：反复请求一批资源，获得后立即释放"""
+    reader, writer = await connect()
+    rng = random.Random(pid)
+    try:
+        while time.perf_counter() < deadline:
+            vector = [rng.randint(0, max_claim) for _ in range(n_resources)]
+            for op in ("request", "release"):
+                message = {"op": op, "pid": pid, "vector": vector}
+                start = time.perf_counter()
+                writer.write((json.dumps(message) + "\n").encode('utf-8'))
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                if "error" in response:
+                    raise RuntimeError(response["error"])
+                if op == "request":
+                    latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_load(clients, n_resources, max_claim, duration, host, port, unix_path):
+    if unix_path:
+        connect = lambda: asyncio.open_unix_connection(unix_path)
+    else:
+        connect = lambda: asyncio.open_connection(host, port)
+
+    latencies = []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(run_client(pid, n_resources, max_claim, deadline, latencies, connect)
+                           for pid in range(clients)))
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="银行家资源管理服务的压测客户端")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="使用Unix套接字路径代替TCP")
+    parser.add_argument("--clients", type=int, default=64, help="并发客户端数，不能超过服务端的进程数")
+    parser.add_argument("--resources", type=int, default=4)
+    parser.add_argument("--max-claim", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="压测时长（秒）")
+    args = parser.parse_args()
+
+    latencies, elapsed = asyncio.run(run_load(args.clients, args.resources, args.max_claim,
+                                              args.duration, args.host, args.port, args.unix))
+    latencies.sort()
+    print(f"决策数：{len(latencies)}")
+    print(f"吞吐量：{len(latencies) / elapsed:.0f} 次/秒")
+    print(f"p50延迟：{percentile(latencies, 0.50) * 1000:.3f} ms")
+    print(f"p99延迟：{percentile(latencies, 0.99) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
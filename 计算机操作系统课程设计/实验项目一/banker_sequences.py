@@ -0,0 +1,80 @@
+from itertools import islice
+from banker import calculate_need
+
+
+def _can_finish(need_row, work):
+    for j in range(len(work)):
+        if need_row[j] > work[j]:
+            return False
+    return True
+
+
+def count_safe_sequences(available, max_matrix, allocation_matrix):
+    """统计全部安全序列的个数
+
+    Work只取决于已完成进程的集合，因此以该集合的位掩码为状态做动态规划，
+    相同集合的不同到达顺序会被合并为同一个状态。
+    """
+    n = len(max_matrix)
+    m = len(available)
+    need = calculate_need(max_matrix, allocation_matrix)
+
+    # 当前层：掩码 -> [到达该状态的序列数, 该状态下的Work]
+    layer = {0: [1, list(available)]}
+    for _ in range(n):
+        next_layer = {}
+        for mask, (ways, work) in layer.items():
+            for p_idx in range(n):
+                bit = 1 << p_idx
+                if mask & bit or not _can_finish(need[p_idx], work):
+                    continue
+                state = next_layer.get(mask | bit)
+                if state is None:
+                    next_work = [work[j] + allocation_matrix[p_idx][j] for j in range(m)]
+                    next_layer[mask | bit] = [ways, next_work]
+                else:
+                    state[0] += ways
+        layer = next_layer
+        if not layer:
+            return 0
+
+    return layer[(1 << n) - 1][0]
+
+
+def iter_safe_sequences(available, max_matrix, allocation_matrix):
+    """按字典序逐个生成安全序列，调用方可以随时停止迭代"""
+    n = len(max_matrix)
+    m = len(available)
+    need = calculate_need(max_matrix, allocation_matrix)
+    full = (1 << n) - 1
+
+    # 已知无法走到全部完成的状态（以已完成进程集合的掩码表示）
+    dead = set()
+    sequence = []
+
+    def extend(mask, work):
+        if mask == full:
+            yield list(sequence)
+            return
+
+        found = False
+        for p_idx in range(n):
+            bit = 1 << p_idx
+            if mask & bit or (mask | bit) in dead or not _can_finish(need[p_idx], work):
+                continue
+            sequence.append(p_idx)
+            next_work = [work[j] + allocation_matrix[p_idx][j] for j in range(m)]
+            for safe_sequence in extend(mask | bit, next_work):
+                found = True
+                yield safe_sequence
+            sequence.pop()
+
+        if not found:
+            dead.add(mask)
+
+    yield from extend(0, list(available))
+
+
+def list_safe_sequences(available, max_matrix, allocation_matrix, limit=None):
+    """返回安全序列列表，limit限制最多返回的个数"""
+    return list(islice(iter_safe_sequences(available, max_matrix, allocation_matrix), limit))
@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import json
+from collections import deque
+from banker import BankerState
+from banker_binary import read_text_state
+
+
+class BankerServer:
+    """持有一份实时银行家状态的资源管理服务
+
+    客户端每行发送一个JSON消息：{"op": "request"/"release", "pid": 进程编号, "vector": [...]}，
+    服务端按行返回结果。同一轮事件循环中到达的请求合并为一次安全性检查，
+    暂时不安全的请求会一直等待，直到某次释放使它变得安全。
+    进程编号归使用它的连接所有，连接断开时取消其等待中的请求并归还这些进程持有的资源。
+    """
+
+    def __init__(self, state):
+        self.state = state
+        # 本轮收到、尚未处理的请求，以及因不安全而等待的请求，元素为(pid, vector, future)
+        self.incoming = []
+        self.waiting = deque()
+        self._batch_scheduled = False
+
+    def submit_request(self, pid, vector):
+        future = asyncio.get_running_loop().create_future()
+        self.incoming.append((pid, vector, future))
+        if not self._batch_scheduled:
+            # 推迟到本轮事件循环末尾处理，让同时到达的请求合并成一批
+            self._batch_scheduled = True
+            asyncio.get_running_loop().call_soon(self._process_batch)
+        return future
+
+    def _process_batch(self):
+        self._batch_scheduled = False
+        # 客户端已断开或取消的请求直接丢弃，不再为它分配资源
+        batch = [item for item in self.incoming if not item[2].cancelled()]
+        self.incoming = []
+        if not batch:
+            return
+
+        try:
+            granted, _ = self.state.request_many([(pid, vector) for pid, vector, _ in batch])
+        except ValueError:
+            granted = False
+        if granted:
+            for _, _, future in batch:
+                future.set_result({"granted": True})
+            return
+
+        # 整批不安全时逐个处理，不安全的请求进入等待队列
+        for pid, vector, future in batch:
+            self._try_grant(pid, vector, future)
+
+    def _try_grant(self, pid, vector, future):
+        try:
+            granted, _ = self.state.request(pid, vector)
+        except ValueError as e:
+            future.set_result({"error": str(e)})
+            return True
+        if granted:
+            future.set_result({"granted": True})
+            return True
+        self.waiting.append((pid, vector, future))
+        return False
+
+    def release(self, pid, vector):
+        self.state.release(pid, vector)
+        # 释放后按到达顺序重试等待中的请求
+        for _ in range(len(self.waiting)):
+            pid, vector, future = self.waiting.popleft()
+            if not future.cancelled():
+                self._try_grant(pid, vector, future)
+        return {"released": True}
+
+    def disconnect(self, pids, future=None):
+        """连接断开：取消它等待中的请求，归还它使用过的进程持有的全部资源"""
+        if future is not None and not future.done():
+            future.cancel()
+        self.waiting = deque(item for item in self.waiting if not item[2].cancelled())
+        for pid in pids:
+            held = list(self.state.allocation_matrix[pid])
+            if any(held):
+                self.release(pid, held)
+        if self.incoming:
+            # 归还的资源可能让本轮收到的请求整批变得安全
+            self._process_batch()
+
+    async def handle_client(self, reader, writer):
+        # 本连接使用过的进程编号、尚未得到结果的请求，以及正在进行的读取
+        pids = set()
+        future = None
+        read_task = None
+        try:
+            while True:
+                if read_task is None:
+                    read_task = asyncio.ensure_future(reader.readline())
+                line = await read_task
+                read_task = None
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    op = message["op"]
+                    pid = int(message["pid"])
+                    vector = [int(v) for v in message["vector"]]
+                    if not 0 <= pid < self.state.n or len(vector) != self.state.m:
+                        raise ValueError("进程编号或资源向量长度不正确")
+                    pids.add(pid)
+                    if op == "request":
+                        future = self.submit_request(pid, vector)
+                        # 等待期间同时读取连接，客户端断开时不再为它保留请求
+                        read_task = asyncio.ensure_future(reader.readline())
+                        await asyncio.wait((future, read_task), return_when=asyncio.FIRST_COMPLETED)
+                        if not future.done() and not read_task.result():
+                            break
+                        response = await future
+                        future = None
+                    elif op == "release":
+                        response = self.release(pid, vector)
+                    else:
+                        raise ValueError(f"未知的操作：{op}")
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"error": str(e)}
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode('utf-8'))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if read_task is not None:
+                read_task.cancel()
+            self.disconnect(pids, future)
+            writer.close()
+
+
+async def serve(state, host="127.0.0.1", port=8765, unix_path=None):
+    server = BankerServer(state)
+    if unix_path:
+        listener = await asyncio.start_unix_server(server.handle_client, path=unix_path)
+    else:
+        listener = await asyncio.start_server(server.handle_client, host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def make_uniform_state(n_processes, n_resources, max_claim, total):
+    """所有进程最大需求相同、初始未分配任何资源的状态"""
+    return BankerState([total] * n_resources,
+                       [[max_claim] * n_resources for _ in range(n_processes)],
+                       [[0] * n_resources for _ in range(n_processes)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="银行家算法资源管理服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="使用Unix套接字路径代替TCP")
+    parser.add_argument("--file", help="从banker_data.txt格式的文件加载初始状态")
+    parser.add_argument("--processes", type=int, default=64)
+    parser.add_argument("--resources", type=int, default=4)
+    parser.add_argument("--max-claim", type=int, default=8)
+    parser.add_argument("--total", type=int, default=128)
+    args = parser.parse_args()
+
+    if args.file:
+        state = BankerState(*read_text_state(args.file))
+    else:
+        state = make_uniform_state(args.processes, args.resources, args.max_claim, args.total)
+
+    try:
+        asyncio.run(serve(state, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import numpy as np
+
+
+def is_safe_state_vectorized(available, max_matrix, allocation_matrix):
+    """基于NumPy数组的安全性检查，返回值与banker.is_safe_state一致"""
+    m = len(available)
+    work = np.array(available, dtype=np.int64)
+    max_matrix = np.asarray(max_matrix, dtype=np.int64).reshape(-1, m)
+    allocation_matrix = np.asarray(allocation_matrix, dtype=np.int64).reshape(-1, m)
+
+    # 计算Need矩阵
+    need = max_matrix - allocation_matrix
+
+    # 尚未完成的进程编号
+    pending = np.arange(need.shape[0])
+    safe_sequence = []
+
+    while pending.size:
+        # 一次向量化比较找出本轮所有可以完成的进程
+        runnable = (need[pending] <= work).all(axis=1)
+        if not runnable.any():
+            return False, []
+
+        # 本轮可完成的进程一次性归还全部已分配资源
+        finished = pending[runnable]
+        safe_sequence.extend(finished.tolist())
+        work += allocation_matrix[finished].sum(axis=0)
+        pending = pending[~runnable]
+
+    return True, safe_sequence
@@ -0,0 +1,257 @@
+from bisect import bisect_right, insort
+from wait_for_graph import WaitForGraph, is_single_instance
+
+
+class DeadlockDetector:
+    """基于分配/请求/释放事件流的多实例资源死锁检测
+
+    与banker.py使用相同的数据布局：Available为列表，Allocation和Request为按进程编号
+    索引的矩阵。只有当请求无法立即满足、进程被阻塞时才运行检测算法。
+    当每类资源都只有一个实例时自动改用等待图，增量地检测环，报告的死锁进程与多实例算法相同。
+    """
+
+    def __init__(self, available, allocation_matrix=None):
+        self.m = len(available)
+        self.available = list(available)
+        self.allocation_matrix = [list(row) for row in allocation_matrix or []]
+        self.request_matrix = [[0] * self.m for _ in self.allocation_matrix]
+
+        # 系统中各类资源的总量，资源只在进程之间流转，总量保持不变
+        self.total = list(self.available)
+        for row in self.allocation_matrix:
+            for j in range(self.m):
+                self.total[j] += row[j]
+
+        # 被阻塞的进程及其阻塞序号，按阻塞的先后顺序保存
+        self.blocked = {}
+        self._block_count = 0
+        # 每类资源上阻塞进程的请求量，按(请求量, 阻塞序号, 进程编号)排序，
+        # 释放时只需检查请求量刚好被新增的可用资源满足的进程
+        self._requests_by_resource = [[] for _ in range(self.m)]
+        self.deadlocked = []
+
+        self.single_instance = is_single_instance(self.available, self.allocation_matrix)
+        if self.single_instance:
+            self.graph = WaitForGraph()
+            # 每类资源的持有者，以及等待该资源的阻塞进程
+            self.holders = [None] * self.m
+            self.waiters = [set() for _ in range(self.m)]
+            for pid, row in enumerate(self.allocation_matrix):
+                for j in range(self.m):
+                    if row[j]:
+                        self.holders[j] = pid
+            # 等待边的重数（同一对进程可能因多类资源而等待），以及因成环而暂未加入图中的边
+            self._edge_count = {}
+            self._deferred = set()
+
+    def _ensure_process(self, pid):
+        while len(self.allocation_matrix) <= pid:
+            self.allocation_matrix.append([0] * self.m)
+            self.request_matrix.append([0] * self.m)
+
+    def allocate(self, pid, vector):
+        """直接把资源分配给进程"""
+        self._ensure_process(pid)
+        for j in range(self.m):
+            if vector[j] > self.available[j]:
+                raise ValueError(f"分配给P{pid}的资源超过了可用资源")
+        for j in range(self.m):
+            self.available[j] -= vector[j]
+            self.allocation_matrix[pid][j] += vector[j]
+
+        if self.single_instance:
+            for j in range(self.m):
+                if vector[j]:
+                    self.holders[j] = pid
+                    for waiter in self.waiters[j]:
+                        self._link(waiter, pid)
+
+    def request(self, pid, vector):
+        """进程请求资源，能满足则立即分配，否则阻塞并运行检测，返回死锁进程列表"""
+        self._ensure_process(pid)
+        if pid in self.blocked:
+            raise ValueError(f"P{pid}已被阻塞，不能再发出请求")
+        for j in range(self.m):
+            if vector[j] > self.total[j]:
+                raise ValueError(f"P{pid}的请求超过了系统中该类资源的总量")
+
+        if all(vector[j] <= self.available[j] for j in range(self.m)):
+            self.allocate(pid, vector)
+            return []
+
+        self.request_matrix[pid] = list(vector)
+        self.blocked[pid] = self._block_count
+        for j in range(self.m):
+            if vector[j]:
+                insort(self._requests_by_resource[j], (vector[j], self._block_count, pid))
+        self._block_count += 1
+
+        if self.single_instance:
+            # 之前没有成环的边时，新出现的环都经过pid的等待边，直接使用插边时得到的环
+            existing_cycle = bool(self._deferred)
+            members = set()
+            for j in range(self.m):
+                if vector[j]:
+                    self.waiters[j].add(pid)
+                    if self.holders[j] is not None:
+                        cycle = self._link(pid, self.holders[j])
+                        if cycle:
+                            members.update(cycle)
+            self.deadlocked = self.detect() if existing_cycle else self._blocked_behind(members)
+        else:
+            self.deadlocked = self.detect()
+        return self.deadlocked
+
+    def release(self, pid, vector):
+        """进程释放资源，并依次唤醒现在可以满足的阻塞进程"""
+        self._ensure_process(pid)
+        for j in range(self.m):
+            if vector[j] > self.allocation_matrix[pid][j]:
+                raise ValueError(f"P{pid}释放的资源超过了其已分配的资源")
+        # 释放前没有可以满足的阻塞进程，因此释放后只可能是某类资源的请求量
+        # 落在(原可用量, 新可用量]之间的进程变得可以满足
+        candidates = {}
+        unlinked = False
+        for j in range(self.m):
+            if not vector[j]:
+                continue
+            requests = self._requests_by_resource[j]
+            start = bisect_right(requests, (self.available[j], float('inf')))
+            end = bisect_right(requests, (self.available[j] + vector[j], float('inf')))
+            for _, order, blocked_pid in requests[start:end]:
+                candidates[order] = blocked_pid
+
+            self.allocation_matrix[pid][j] -= vector[j]
+            self.available[j] += vector[j]
+            if self.single_instance:
+                self.holders[j] = None
+                for waiter in self.waiters[j]:
+                    self._unlink(waiter, pid)
+                    unlinked = True
+
+        # 按阻塞的先后顺序唤醒
+        for order in sorted(candidates):
+            blocked_pid = candidates[order]
+            request = self.request_matrix[blocked_pid]
+            if all(request[j] <= self.available[j] for j in range(self.m)):
+                del self.blocked[blocked_pid]
+                self.request_matrix[blocked_pid] = [0] * self.m
+                for j in range(self.m):
+                    if request[j]:
+                        requests = self._requests_by_resource[j]
+                        del requests[bisect_right(requests, (request[j], order, blocked_pid)) - 1]
+                        if self.single_instance:
+                            self.waiters[j].discard(blocked_pid)
+                self.allocate(blocked_pid, request)
+
+        if unlinked and self._deferred:
+            # 删除等待边后原先成环的边可能已经可以加入图中
+            for u, v in list(self._deferred):
+                if self.graph.add_edge(u, v) is None:
+                    self._deferred.discard((u, v))
+        return []
+
+    def _link(self, u, v):
+        """增加一条等待边u->v，若形成环则返回环上的进程"""
+        count = self._edge_count.get((u, v), 0)
+        self._edge_count[(u, v)] = count + 1
+        if count:
+            return None
+        cycle = self.graph.add_edge(u, v)
+        if cycle:
+            self._deferred.add((u, v))
+        return cycle
+
+    def _unlink(self, u, v):
+        count = self._edge_count.pop((u, v)) - 1
+        if count:
+            self._edge_count[(u, v)] = count
+        elif (u, v) in self._deferred:
+            self._deferred.discard((u, v))
+        else:
+            self.graph.remove_edge(u, v)
+
+    def _blocked_behind(self, members):
+        """等待图中环上的进程members，加上沿等待边能到达它们、且持有资源的阻塞进程
+
+        等待死锁进程所持资源的进程同样永远无法完成，使结果与多实例的检测算法一致。
+        """
+        reached = set(members)
+        stack = list(members)
+        while stack:
+            allocation = self.allocation_matrix[stack.pop()]
+            for j in range(self.m):
+                if allocation[j]:
+                    for waiter in self.waiters[j]:
+                        if waiter not in reached:
+                            reached.add(waiter)
+                            stack.append(waiter)
+        return sorted(pid for pid in reached if any(self.allocation_matrix[pid]))
+
+    def detect(self):
+        """死锁检测算法，返回处于死锁的进程编号（升序）
+
+        死锁进程是持有资源、且在所有未阻塞进程完成并归还资源后仍无法满足请求的阻塞进程，
+        包括环上的进程和等待它们的进程。单实例和多实例模式返回的集合相同。
+        """
+        if self.single_instance:
+            return self._blocked_behind(self.graph.cycle_members(self._deferred))
+
+        # 未阻塞的进程没有未满足的请求，必然能够完成并归还资源，
+        # 因此Work等于资源总量减去阻塞进程持有的资源
+        work = list(self.total)
+        waiting = []
+        for pid in self.blocked:
+            allocation = self.allocation_matrix[pid]
+            for j in range(self.m):
+                work[j] -= allocation[j]
+            # 不持有任何资源的进程不会参与死锁
+            if any(allocation):
+                waiting.append(pid)
+
+        found = True
+        while found and waiting:
+            found = False
+            still_waiting = []
+            for pid in waiting:
+                request = self.request_matrix[pid]
+                if all(request[j] <= work[j] for j in range(self.m)):
+                    allocation = self.allocation_matrix[pid]
+                    for j in range(self.m):
+                        work[j] += allocation[j]
+                    found = True
+                else:
+                    still_waiting.append(pid)
+            waiting = still_waiting
+
+        return sorted(waiting)
+
+    def feed(self, event):
+        """处理一个事件(操作, 进程编号, 资源向量)，返回此时检测到的死锁进程列表"""
+        operation, pid, vector = event
+        if operation == "allocate":
+            self.allocate(pid, vector)
+            return []
+        if operation == "request":
+            return self.request(pid, vector)
+        if operation == "release":
+            return self.release(pid, vector)
+        raise ValueError(f"未知的事件类型：{operation}")
+
+    def run(self, events):
+        """消费事件流，每当检测到死锁时产生(事件序号, 死锁进程列表)"""
+        for index, event in enumerate(events):
+            deadlocked = self.feed(event)
+            if deadlocked:
+                yield index, deadlocked
+
+
+def read_events(filename):
+    """逐行读取事件日志，每行格式为：操作 进程编号 资源1 资源2 ..."""
+    with open(filename, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            values = line.split()
+            yield values[0], int(values[1]), [int(v) for v in values[2:]]
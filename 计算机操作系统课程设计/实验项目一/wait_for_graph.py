@@ -0,0 +1,164 @@
+def is_single_instance(available, allocation_matrix):
+    """每类资源的总量(Available加上Allocation的列和)是否都为1"""
+    if not available:
+        return False
+    for j in range(len(available)):
+        if available[j] + sum(row[j] for row in allocation_matrix) != 1:
+            return False
+    return True
+
+
+class WaitForGraph:
+    """单实例资源下的等待图，增量维护拓扑序来检测环(Pearce-Kelly算法)
+
+    图中始终保持无环：会形成环的边不会被加入，add_edge返回环上的进程。
+    """
+
+    def __init__(self):
+        self.successors = {}
+        self.predecessors = {}
+        # 节点的拓扑序号，每条边u->v都满足order[u] < order[v]
+        self.order = {}
+        self._next_order = 0
+
+    def add_node(self, node):
+        if node not in self.order:
+            self.successors[node] = set()
+            self.predecessors[node] = set()
+            self.order[node] = self._next_order
+            self._next_order += 1
+
+    def remove_node(self, node):
+        if node not in self.order:
+            return
+        for succ in self.successors.pop(node):
+            self.predecessors[succ].discard(node)
+        for pred in self.predecessors.pop(node):
+            self.successors[pred].discard(node)
+        del self.order[node]
+
+    def has_edge(self, u, v):
+        return u in self.successors and v in self.successors[u]
+
+    def add_edge(self, u, v):
+        """加入等待边u->v，无环时返回None，否则不加入该边并返回经过该边的环上的全部进程"""
+        self.add_node(u)
+        self.add_node(v)
+        if v in self.successors[u]:
+            return None
+        if u == v:
+            return [u]
+
+        lower, upper = self.order[v], self.order[u]
+        if lower < upper:
+            # 新边违反了当前拓扑序，只调整order在[lower, upper]之间受影响的节点
+            forward = self._forward(v, upper)
+            backward = self._backward(u, lower)
+            if u in forward:
+                # 既能从v到达又能到达u的节点都在经过u->v的环上
+                members = set(forward).intersection(backward)
+                members.add(v)
+                return sorted(members, key=self.order.__getitem__)
+            self._reorder(forward, backward)
+
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+        return None
+
+    def remove_edge(self, u, v):
+        # 删除边不会破坏拓扑序
+        if self.has_edge(u, v):
+            self.successors[u].discard(v)
+            self.predecessors[v].discard(u)
+
+    def cycle_members(self, extra_edges):
+        """图中加入extra_edges后位于环上的全部节点（Tarjan强连通分量）
+
+        图本身无环，所以每个环都至少经过一条额外的边，只需从这些边的端点出发搜索。
+        """
+        extra = {}
+        for u, v in extra_edges:
+            extra.setdefault(u, []).append(v)
+
+        def neighbours(node):
+            yield from self.successors.get(node, ())
+            yield from extra.get(node, ())
+
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        members = set()
+        counter = 0
+        for root in extra:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, neighbours(root))]
+            while work:
+                node, it = work[-1]
+                advanced = False
+                for succ in it:
+                    if succ not in index:
+                        index[succ] = low[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, neighbours(succ)))
+                        advanced = True
+                        break
+                    if succ in on_stack:
+                        low[node] = min(low[node], index[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        top = stack.pop()
+                        on_stack.discard(top)
+                        component.append(top)
+                        if top == node:
+                            break
+                    if len(component) > 1 or node in extra.get(node, ()):
+                        members.update(component)
+        return members
+
+    def _forward(self, start, upper):
+        """从start出发只访问order不超过upper的节点"""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for succ in self.successors[node]:
+                if succ not in visited and self.order[succ] <= upper:
+                    visited.add(succ)
+                    stack.append(succ)
+        return list(visited)
+
+    def _backward(self, start, lower):
+        """从start沿反向边只访问order大于lower的节点"""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for pred in self.predecessors[node]:
+                if pred not in visited and self.order[pred] > lower:
+                    visited.add(pred)
+                    stack.append(pred)
+        return list(visited)
+
+    def _reorder(self, forward, backward):
+        # 受影响节点原有的序号集合重新分配：反向可达的节点排在正向可达的节点之前
+        backward.sort(key=self.order.__getitem__)
+        forward.sort(key=self.order.__getitem__)
+        nodes = backward + forward
+        slots = sorted(self.order[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            self.order[node] = slot
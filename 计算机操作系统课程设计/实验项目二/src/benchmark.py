@@ -0,0 +1,199 @@
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from workload import Workload
+from stream_cli import SCHEDULERS, make_scheduler
+
+# 各种形状的进程集合：到达时间和运行时间的分布不同，平均负载都接近满载
+def uniform_shape(rng, n):
+    """到达时间在[0, 5n)内均匀分布，运行时间1~9"""
+    return [rng.randrange(5 * n) for _ in range(n)], [rng.randint(1, 9) for _ in range(n)]
+
+def batch_shape(rng, n):
+    """全部在0时刻到达，就绪队列最长"""
+    return [0] * n, [rng.randint(1, 9) for _ in range(n)]
+
+def poisson_shape(rng, n):
+    """泊松到达，平均到达间隔5，运行时间服从均值4.5的指数分布"""
+    arrivals, bursts, t = [], [], 0.0
+    for _ in range(n):
+        t += rng.expovariate(1 / 5)
+        arrivals.append(int(t))
+        bursts.append(max(1, round(rng.expovariate(1 / 4.5))))
+    return arrivals, bursts
+
+def heavy_tail_shape(rng, n):
+    """泊松到达，运行时间服从帕累托分布，少数长作业占去大部分处理机时间"""
+    arrivals, _ = poisson_shape(rng, n)
+    return arrivals, [min(10000, max(1, int(rng.paretovariate(1.5)))) for _ in range(n)]
+
+SHAPES = {
+    "uniform": uniform_shape,
+    "batch": batch_shape,
+    "poisson": poisson_shape,
+    "heavy_tail": heavy_tail_shape,
+}
+
+def make_workload(shape, n, seed):
+    rng = random.Random(f"{shape}-{n}-{seed}")
+    arrivals, bursts = SHAPES[shape](rng, n)
+    priorities = [rng.randint(0, 9) for _ in range(n)]
+    return Workload([f"P{i}" for i in range(n)], arrivals, bursts, priorities)
+
+def measure(algorithm, workload, quantum, memory, repeat=1):
+    """计时schedule()调用，重复repeat次取最短耗时；memory为True时再运行一次记录峰值内存"""
+    seconds = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        scheduler = make_scheduler(algorithm, quantum)
+        start = time.perf_counter()
+        segments = scheduler.schedule(workload)
+        seconds = min(seconds, time.perf_counter() - start)
+    result = {
+        "seconds": seconds,
+        "segments": len(segments),
+        # 结果指纹：算法行为变化时这些值会变化
+        "avg_turnaround": scheduler.get_average_turnaround_time(),
+        "avg_waiting": scheduler.get_average_waiting_time(),
+    }
+    del segments
+    
+    if memory:
+        gc.collect()
+        scheduler = make_scheduler(algorithm, quantum)
+        tracemalloc.start()
+        # 峰值在执行段列表释放后仍然保留
+        scheduler.schedule(workload)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+def scaling_exponent(points):
+    """对 (进程数, 秒数) 做双对数最小二乘拟合，斜率约为1表示线性，约为2表示平方"""
+    points = [(math.log(n), math.log(s)) for n, s in points if s > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx if sxx else None
+
+def run_benchmarks(algorithms, shapes, sizes, seed=0, quantum=2, memory=True, max_seconds=None, repeat=1,
+                   log=None):
+    results = []
+    scaling = {}
+    for shape in shapes:
+        skipped = set()
+        for n in sizes:
+            workload = make_workload(shape, n, seed)
+            for algorithm in algorithms:
+                if algorithm in skipped:
+                    continue
+                entry = {"algorithm": algorithm, "shape": shape, "size": n, "seed": seed, "quantum": quantum}
+                entry.update(measure(algorithm, workload, quantum, memory, repeat))
+                results.append(entry)
+                if log:
+                    log(entry)
+                # 超过时间上限的算法不再测更大的规模
+                if max_seconds is not None and entry["seconds"] > max_seconds:
+                    skipped.add(algorithm)
+            del workload
+        for algorithm in algorithms:
+            points = [(r["size"], r["seconds"]) for r in results
+                      if r["shape"] == shape and r["algorithm"] == algorithm]
+            scaling[f"{algorithm}/{shape}"] = scaling_exponent(points)
+    return results, scaling
+
+def compare(old, new, threshold=1.5, exponent_slack=0.3, min_seconds=0.05):
+    """对比两次结果，返回发现的问题列表：耗时变慢超过threshold倍、增长阶升高、结果指纹改变
+
+    耗时都不到min_seconds的测量受计时误差影响大，不参与耗时比较。
+    """
+    problems = []
+    old_results = {(r["algorithm"], r["shape"], r["size"], r["seed"], r["quantum"]): r for r in old["results"]}
+    for r in new["results"]:
+        before = old_results.get((r["algorithm"], r["shape"], r["size"], r["seed"], r["quantum"]))
+        if before is None:
+            continue
+        label = f"{r['algorithm']}/{r['shape']}/n={r['size']}"
+        # 用乘法比较，原耗时为0时也不会除零
+        if max(before["seconds"], r["seconds"]) >= min_seconds and r["seconds"] > threshold * before["seconds"]:
+            problems.append(f"{label}：耗时 {before['seconds']:.3f}s -> {r['seconds']:.3f}s")
+        for key in ("avg_turnaround", "avg_waiting"):
+            if not math.isclose(before[key], r[key], rel_tol=1e-9):
+                problems.append(f"{label}：{key} {before[key]} -> {r[key]}")
+    for key, exponent in new["scaling"].items():
+        before = old["scaling"].get(key)
+        if exponent is not None and before is not None and exponent > before + exponent_slack:
+            problems.append(f"{key}：增长阶 {before:.2f} -> {exponent:.2f}")
+    return problems
+
+def parse_sizes(text):
+    """解析“1e3,1e4,1e5”形式的规模列表"""
+    return [int(float(v)) for v in text.split(',')]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="不启动界面，测量各调度算法随进程数增长的耗时和内存")
+    parser.add_argument("--algorithms", default="fcfs,sjf,priority,hrrn,rr", help="逗号分隔的算法名")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="逗号分隔的进程集合形状")
+    parser.add_argument("--sizes", default="1e3,1e4,1e5", help="逗号分隔的进程数，最大可到1e7")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--no-memory", action="store_true", help="不测峰值内存（测内存需要再运行一次）")
+    parser.add_argument("--max-seconds", type=float, help="某算法单次超过这个耗时后跳过更大的规模")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复计时的次数，取最短耗时")
+    parser.add_argument("--output", help="结果JSON文件")
+    parser.add_argument("--compare", help="与之前的结果JSON对比，发现退化时返回1")
+    parser.add_argument("--threshold", type=float, default=1.5, help="判定为变慢的耗时倍数")
+    parser.add_argument("--exponent-slack", type=float, default=0.3, help="增长阶允许升高的幅度")
+    args = parser.parse_args(argv)
+    
+    algorithms = args.algorithms.split(',')
+    shapes = args.shapes.split(',')
+    for algorithm in algorithms:
+        if algorithm not in SCHEDULERS:
+            parser.error(f"未知的算法：{algorithm}")
+    for shape in shapes:
+        if shape not in SHAPES:
+            parser.error(f"未知的形状：{shape}")
+    
+    def log(entry):
+        memory = f"{entry['peak_bytes'] / 2 ** 20:9.1f} MB" if "peak_bytes" in entry else ""
+        print(f"{entry['algorithm']:>10} {entry['shape']:>10} {entry['size']:>9} "
+              f"{entry['seconds']:9.3f} s {memory}", flush=True)
+    
+    results, scaling = run_benchmarks(algorithms, shapes, parse_sizes(args.sizes), args.seed, args.quantum,
+                                      not args.no_memory, args.max_seconds, args.repeat, log)
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+        "scaling": scaling,
+    }
+    for key, exponent in scaling.items():
+        if exponent is not None:
+            print(f"{key}：增长阶 {exponent:.2f}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2, sort_keys=True)
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            problems = compare(json.load(file), report, args.threshold, args.exponent_slack)
+        for problem in problems:
+            print(problem)
+        if problems:
+            return 1
+        print("与之前的结果相比没有退化")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
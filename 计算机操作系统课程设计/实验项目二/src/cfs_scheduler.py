@@ -0,0 +1,132 @@
+import random
+from event_scheduler import EventScheduler
+
+# Linux的nice值到权重的映射，nice从-20到19，相邻两级的CPU份额约差10%
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+NICE_0_WEIGHT = 1024
+
+def priority_to_weight(priority):
+    """把Process.priority当作nice值（数值越小优先级越高），超出范围时截断到[-20, 19]"""
+    nice = min(19, max(-20, priority))
+    return NICE_TO_WEIGHT[nice + 20]
+
+class _Node:
+    __slots__ = ('key', 'item', 'forward')
+    
+    def __init__(self, key, item, level):
+        self.key = key
+        self.item = item
+        self.forward = [None] * level
+
+class SkipList:
+    """按键有序的跳表，期望O(log n)插入，O(1)取出最小元素"""
+    
+    MAX_LEVEL = 32
+    
+    def __init__(self, seed=0):
+        self.head = _Node(None, None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self.rng = random.Random(seed)
+    
+    def __len__(self):
+        return self.size
+    
+    def insert(self, key, item):
+        update = [self.head] * self.MAX_LEVEL
+        node = self.head
+        for lv in range(self.level - 1, -1, -1):
+            while node.forward[lv] is not None and node.forward[lv].key < key:
+                node = node.forward[lv]
+            update[lv] = node
+        
+        level = 1
+        while level < self.MAX_LEVEL and self.rng.random() < 0.5:
+            level += 1
+        self.level = max(self.level, level)
+        new = _Node(key, item, level)
+        for lv in range(level):
+            new.forward[lv] = update[lv].forward[lv]
+            update[lv].forward[lv] = new
+        self.size += 1
+    
+    def pop_min(self):
+        first = self.head.forward[0]
+        for lv in range(len(first.forward)):
+            self.head.forward[lv] = first.forward[lv]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return first.item
+
+class CFSScheduler(EventScheduler):
+    """完全公平调度（CFS）
+    
+    每个进程的虚拟运行时间按 实际运行时间 * NICE_0_WEIGHT / 权重 增长，总是选择虚拟运行时间最小的进程，
+    就绪进程按 (虚拟运行时间, 入队序号) 保存在跳表中。时间片为 sched_latency 按权重分配的份额，
+    但不小于 min_granularity。新进程的虚拟运行时间从当前的最小值开始，在当前时间片结束后参与选择。
+    """
+    
+    time_sliced = True
+    coalesce_slices = True
+    
+    def __init__(self, sched_latency=12, min_granularity=2):
+        super().__init__()
+        if min_granularity < 1 or sched_latency < min_granularity:
+            raise ValueError("要求 1 <= min_granularity <= sched_latency")
+        self.sched_latency = sched_latency
+        self.min_granularity = min_granularity
+    
+    def get_name(self):
+        return f"完全公平调度(CFS, 调度周期={self.sched_latency})"
+    
+    def reset_ready(self):
+        self.tree = SkipList()
+        self.sequence = 0
+        self.vruntime = {}
+        self.weight = {}
+        # 就绪和正在运行的进程的权重之和
+        self.total_weight = 0
+        self.min_vruntime = 0
+    
+    def insert(self, i):
+        self.tree.insert((self.vruntime[i], self.sequence), i)
+        self.sequence += 1
+    
+    def add_ready(self, i):
+        weight = priority_to_weight(self.priority[i])
+        self.weight[i] = weight
+        self.total_weight += weight
+        self.vruntime[i] = self.min_vruntime
+        self.insert(i)
+    
+    def requeue(self, i):
+        self.insert(i)
+    
+    def pick_next(self):
+        i = self.tree.pop_min()
+        self.min_vruntime = max(self.min_vruntime, self.vruntime[i])
+        return i
+    
+    def has_ready(self):
+        return bool(self.tree)
+    
+    def time_slice(self, i):
+        return max(self.min_granularity, self.sched_latency * self.weight[i] // self.total_weight)
+    
+    def slice_finished(self, i, ran, expired):
+        # 虚拟运行时间以 1/NICE_0_WEIGHT 个时间单位为单位保存为整数，避免浮点误差
+        self.vruntime[i] += ran * NICE_0_WEIGHT * NICE_0_WEIGHT // self.weight[i]
+    
+    def forget(self, i):
+        self.total_weight -= self.weight.pop(i)
+        del self.vruntime[i]
\ No newline at end of file
@@ -0,0 +1,247 @@
+import heapq
+from abc import abstractmethod
+from array import array
+from scheduler import Scheduler
+from process import ProcessState
+from workload import Workload
+
+# 事件类型：同一时刻先处理到达事件，再处理运行进程的完成或时间片到期
+ARRIVAL = 0
+COMPLETION = 1
+QUANTUM_EXPIRY = 2
+
+class EventScheduler(Scheduler):
+    """基于事件队列的调度核心
+    
+    到达、完成和时间片到期都作为事件放在堆中，时间直接跳到下一个事件，
+    开销只与事件数有关而与时间长度无关。子类只需实现就绪队列的几个方法：
+    add_ready / pick_next / has_ready，按需覆盖 requeue、time_slice 和 should_preempt。
+    进程在内部用下标表示，属性直接使用 Workload 的 arrival、burst、priority 等列，
+    结果写入 Workload 预先分配的 completion、turnaround、waiting 列。
+    stream 方法以流的方式运行同一套调度逻辑，只保存尚未完成的进程。
+    """
+    
+    # 新进程到达时是否检查抢占
+    preemptive = False
+    # 是否按时间片轮流运行，进程会分成多段交错执行
+    time_sliced = False
+    # 只有一个就绪进程时是否把它连续的多个时间片合并成一段执行
+    coalesce_slices = False
+    # 是否记录完成顺序以提供 completed_processes；只需要统计量时可以关闭，不再占用与进程数成正比的内存
+    keep_completed = True
+    
+    def __init__(self):
+        super().__init__()
+        self.workload = Workload()
+        self.completion_order = array('q')
+        # 已经开始运行、尚未完成的进程的首次运行时间，用于计算响应时间
+        self.first_start = {}
+    
+    @property
+    def completed_count(self):
+        return self.metrics.count
+    
+    def schedule(self, processes):
+        """processes 可以是 Process 列表，也可以是 Workload"""
+        self.processes = processes
+        workload = processes if isinstance(processes, Workload) else Workload.from_processes(processes)
+        execution_sequence = list(self.run(workload))
+        
+        if workload is processes:
+            self.completed_processes = workload.select(self.completion_order)
+        else:
+            # 把结果写回 Process 对象
+            for i, process in enumerate(processes):
+                process.completion_time = workload.completion[i]
+                process.turnaround_time = workload.turnaround[i]
+                process.waiting_time = workload.waiting[i]
+                process.state = ProcessState.READY
+            self.completed_processes = [processes[i] for i in self.completion_order]
+        return execution_sequence
+    
+    def run(self, workload):
+        """在 Workload 上调度，逐个产生执行段而不保存"""
+        self.use_workload(workload)
+        arrival_order = sorted(range(len(workload)), key=self.arrival.__getitem__)
+        return self.simulate(iter(arrival_order))
+    
+    def use_workload(self, workload):
+        self.workload = workload
+        self.current_time = 0
+        self.completed_processes = []
+        self.completion_order = array('q')
+        
+        self.ids = workload.ids
+        self.arrival = workload.arrival
+        self.burst = workload.burst
+        self.priority = workload.priority
+        self.remaining = array('q', workload.burst)
+        workload.reset_results()
+        self.metrics.reset()
+        self.first_start = {}
+    
+    def stream(self, arrivals):
+        """流式调度
+        
+        arrivals 是按到达时间非递减给出的 (进程ID, 到达时间, 运行时间, 优先级) 迭代器，
+        只在模拟推进到需要时才读取下一项；产生 (进程ID, 开始时间, 结束时间) 执行段。
+        进程完成后即被丢弃，内存只与同时存在的进程数有关，metrics 中的统计量随时可以读取。
+        """
+        self.processes = []
+        self.workload = None
+        self.current_time = 0
+        self.completed_processes = []
+        self.completion_order = array('q')
+        self.metrics.reset()
+        self.first_start = {}
+        
+        # 以递增的编号作为进程下标，各列用字典保存，进程完成时删除
+        self.ids = {}
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {}
+        self.remaining = {}
+        
+        def indices():
+            last_arrival = None
+            for i, (pid, arrival_time, burst_time, priority) in enumerate(arrivals):
+                if last_arrival is not None and arrival_time < last_arrival:
+                    raise ValueError(f"进程{pid}的到达时间早于前一个进程，输入必须按到达时间排序")
+                last_arrival = arrival_time
+                self.ids[i] = pid
+                self.arrival[i] = arrival_time
+                self.burst[i] = burst_time
+                self.priority[i] = priority
+                self.remaining[i] = burst_time
+                yield i
+        
+        return self.simulate(indices())
+    
+    def record_completion(self, i):
+        """进程i在current_time完成时调用"""
+        turnaround = self.current_time - self.arrival[i]
+        waiting = turnaround - self.burst[i]
+        response = self.first_start.pop(i) - self.arrival[i]
+        self.metrics.record(turnaround, waiting, response)
+        
+        if self.workload is None:
+            for column in (self.ids, self.arrival, self.burst, self.priority, self.remaining):
+                del column[i]
+        else:
+            self.workload.completion[i] = self.current_time
+            self.workload.turnaround[i] = turnaround
+            self.workload.waiting[i] = waiting
+            if self.keep_completed:
+                self.completion_order.append(i)
+        self.forget(i)
+    
+    @abstractmethod
+    def reset_ready(self):
+        """清空就绪队列"""
+    
+    @abstractmethod
+    def add_ready(self, i):
+        """新到达的进程i进入就绪队列"""
+    
+    @abstractmethod
+    def pick_next(self):
+        """取出下一个要运行的进程下标"""
+    
+    @abstractmethod
+    def has_ready(self):
+        """就绪队列是否非空"""
+    
+    def requeue(self, i):
+        """时间片用完或被抢占的进程重新进入就绪队列"""
+        self.add_ready(i)
+    
+    def time_slice(self, i):
+        """进程i本次最多运行的时间，None表示一直运行到结束"""
+        return None
+    
+    def should_preempt(self, running):
+        """有新进程到达后，是否抢占正在运行的进程"""
+        return False
+    
+    def preempt_rank(self, running):
+        """正在运行的进程的抢占次序，越大越先被抢占；多处理机共用就绪队列时用来选择被抢占的处理机"""
+        return 0
+    
+    def slice_finished(self, i, ran, expired):
+        """进程i运行了ran时间后让出处理机（expired为True表示时间片用完）"""
+    
+    def forget(self, i):
+        """进程i完成后，释放就绪队列为它保存的数据"""
+    
+    def simulate(self, arrivals):
+        """事件驱动的模拟循环
+        
+        arrivals 按到达时间升序给出进程下标，只在需要时才读取下一个；
+        产生 (进程ID, 开始时间, 结束时间) 的执行段。
+        """
+        self.reset_ready()
+        events = []
+        version = 0
+        
+        def push_next_arrival():
+            i = next(arrivals, None)
+            if i is not None:
+                heapq.heappush(events, (self.arrival[i], ARRIVAL, 0, i))
+        
+        push_next_arrival()
+        running = None
+        segment_start = 0
+        accounted = 0
+        
+        while events:
+            now = events[0][0]
+            self.current_time = now
+            
+            # 处理同一时刻的全部事件之后再做调度决策
+            cpu_event = None
+            arrived = False
+            while events and events[0][0] == now:
+                _, kind, token, i = heapq.heappop(events)
+                if kind == ARRIVAL:
+                    push_next_arrival()
+                    self.add_ready(i)
+                    arrived = True
+                elif token == version:
+                    cpu_event = kind
+            
+            if running is not None:
+                self.remaining[running] -= now - accounted
+                accounted = now
+                if cpu_event is not None:
+                    yield self.ids[running], segment_start, now
+                    if self.remaining[running] == 0:
+                        self.record_completion(running)
+                    else:
+                        self.slice_finished(running, now - segment_start, True)
+                        self.requeue(running)
+                    running = None
+                elif arrived and self.preemptive and self.should_preempt(running):
+                    yield self.ids[running], segment_start, now
+                    self.slice_finished(running, now - segment_start, False)
+                    self.requeue(running)
+                    running = None
+                    # 作废被抢占进程尚未发生的事件
+                    version += 1
+            
+            if running is None and self.has_ready():
+                running = self.pick_next()
+                self.first_start.setdefault(running, now)
+                segment_start = accounted = now
+                run = self.remaining[running]
+                quantum = self.time_slice(running)
+                if quantum is not None and quantum < run:
+                    if self.coalesce_slices and not self.has_ready():
+                        # 下一个进程到达之前它会连续获得时间片，直接快进到到达之后的时间片边界
+                        if events:
+                            quanta = max(1, -(-(events[0][0] - now) // quantum))
+                            run = min(run, quanta * quantum)
+                    else:
+                        run = quantum
+                version += 1
+                kind = COMPLETION if run == self.remaining[running] else QUANTUM_EXPIRY
+                heapq.heappush(events, (now + run, kind, version, running))
\ No newline at end of file
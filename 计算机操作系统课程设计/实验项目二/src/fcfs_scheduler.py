@@ -1,30 +1,19 @@
-from scheduler import Scheduler
-from process import ProcessState
+from collections import deque
+from event_scheduler import EventScheduler
 
-class FCFSScheduler(Scheduler):
+class FCFSScheduler(EventScheduler):
     def get_name(self):
         return "先来先服务(FCFS)"
     
-    def schedule(self, processes):
-        self.processes = sorted(processes, key=lambda p: p.arrival_time)
-        self.current_time = 0
-        self.completed_processes = []
-        execution_sequence = []
-        
-        for process in self.processes:
-            if self.current_time < process.arrival_time:
-                self.current_time = process.arrival_time
-                
-            process.state = ProcessState.RUNNING
-            process.waiting_time = self.current_time - process.arrival_time
-            
-            execution_sequence.append((process.id, self.current_time, self.current_time + process.burst_time))
-            
-            self.current_time += process.burst_time
-            process.completion_time = self.current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            
-            process.state = ProcessState.READY
-            self.completed_processes.append(process)
-        
-        return execution_sequence
\ No newline at end of file
+    def reset_ready(self):
+        # 进程按到达顺序进入队列，到达时间相同的保持输入顺序
+        self.ready_queue = deque()
+    
+    def add_ready(self, i):
+        self.ready_queue.append(i)
+    
+    def pick_next(self):
+        return self.ready_queue.popleft()
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
\ No newline at end of file
@@ -1,7 +1,121 @@
-from scheduler import Scheduler
-from process import ProcessState
+import math
+from event_scheduler import EventScheduler
 
-class HRRNScheduler(Scheduler):
+class ResponseRatioTournament:
+    """按响应比选取进程的动力学锦标赛树(kinetic tournament)
+    
+    响应比 (t - a + b) / b = 1 + (t - a) / b 是当前时间t的一次函数，选择响应比最高的进程
+    就是在这些直线的上包络上查询。每个内部节点记录子树中当前的胜者，以及胜者可能被
+    超越的最早时间；时间只会前进，推进时间时只重新比较已经失效的节点，插入和删除
+    只更新一条根路径。响应比相同时编号(key)较小者获胜。
+    """
+    
+    def __init__(self):
+        self.capacity = 1
+        self.size = 0
+        self.now = 0
+        # 叶子槽位上的进程数据
+        self.keys = [None]
+        self.arrivals = [0]
+        self.bursts = [1]
+        self.free_slots = [0]
+        # 完全二叉树，节点i的子节点为2i和2i+1，叶子从capacity开始
+        self.winner = [-1, -1]
+        self.melt = [math.inf, math.inf]
+    
+    def __len__(self):
+        return self.size
+    
+    def insert(self, key, arrival_time, burst_time, now):
+        self.advance(now)
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+        self.keys[slot] = key
+        self.arrivals[slot] = arrival_time
+        self.bursts[slot] = burst_time
+        self.size += 1
+        self._update_leaf(slot, slot)
+    
+    def pop_max(self, now):
+        """返回当前响应比最高的进程编号并将其移出"""
+        self.advance(now)
+        slot = self.winner[1]
+        key = self.keys[slot]
+        self.keys[slot] = None
+        self.free_slots.append(slot)
+        self.size -= 1
+        self._update_leaf(slot, -1)
+        return key
+    
+    def advance(self, now):
+        if now > self.now:
+            self.now = now
+            self._advance(1)
+    
+    def _advance(self, node):
+        if node >= self.capacity or self.melt[node] > self.now:
+            return
+        self._advance(2 * node)
+        self._advance(2 * node + 1)
+        self._combine(node)
+    
+    def _update_leaf(self, slot, winner):
+        node = self.capacity + slot
+        self.winner[node] = winner
+        node //= 2
+        while node:
+            self._combine(node)
+            node //= 2
+    
+    def _combine(self, node):
+        left, right = 2 * node, 2 * node + 1
+        first, second = self.winner[left], self.winner[right]
+        melt = min(self.melt[left], self.melt[right])
+        if first < 0 or second < 0:
+            self.winner[node] = first if second < 0 else second
+            self.melt[node] = melt
+            return
+        
+        # 比较 (t - a1 + b1) / b1 与 (t - a2 + b2) / b2，交叉相乘避免除法误差
+        t = self.now
+        a1, b1 = self.arrivals[first], self.bursts[first]
+        a2, b2 = self.arrivals[second], self.bursts[second]
+        lhs = (t - a1 + b1) * b2
+        rhs = (t - a2 + b2) * b1
+        if lhs > rhs or (lhs == rhs and self.keys[first] < self.keys[second]):
+            win, lose = first, second
+        else:
+            win, lose = second, first
+        self.winner[node] = win
+        
+        # 败者的斜率1/b更大时，它会在两条直线的交点处追上胜者
+        aw, bw = self.arrivals[win], self.bursts[win]
+        al, bl = self.arrivals[lose], self.bursts[lose]
+        if bl < bw:
+            crossing = ((al - bl) * bw - (aw - bw) * bl) / (bw - bl)
+            # 取不大于交点的浮点数：提前重新比较只会多做一次精确比较，不会漏掉胜者的变化
+            melt = min(melt, math.nextafter(crossing, -math.inf))
+        self.melt[node] = melt
+    
+    def _grow(self):
+        old_capacity = self.capacity
+        self.capacity *= 2
+        self.keys.extend([None] * old_capacity)
+        self.arrivals.extend([0] * old_capacity)
+        self.bursts.extend([1] * old_capacity)
+        self.free_slots.extend(range(self.capacity - 1, old_capacity - 1, -1))
+        
+        winner = [-1] * (2 * self.capacity)
+        for slot in range(old_capacity):
+            if self.keys[slot] is not None:
+                winner[self.capacity + slot] = slot
+        self.winner = winner
+        self.melt = [math.inf] * (2 * self.capacity)
+        for node in range(self.capacity - 1, 0, -1):
+            self._combine(node)
+
+class HRRNScheduler(EventScheduler):
     def get_name(self):
         return "高响应比(HRRN)"
     
@@ -9,41 +123,15 @@ class HRRNScheduler(Scheduler):
         waiting_time = current_time - process.arrival_time
         return (waiting_time + process.burst_time) / process.burst_time
     
-    def schedule(self, processes):
-        self.processes = processes
-        self.current_time = 0
-        self.completed_processes = []
-        remaining_processes = self.processes.copy()
-        
-        while remaining_processes:
-            # 获取当前时间点可执行的进程
-            available_processes = [
-                p for p in remaining_processes 
-                if p.arrival_time <= self.current_time
-            ]
-            
-            if not available_processes:
-                # 如果没有可用进程，时间推进到下一个进程的到达时间
-                self.current_time = min(p.arrival_time for p in remaining_processes)
-                continue
-            
-            # 计算每个可用进程的响应比，选择响应比最高的进程
-            process = max(
-                available_processes,
-                key=lambda p: self.calculate_response_ratio(p, self.current_time)
-            )
-            process.state = ProcessState.RUNNING
-            
-            # 计算等待时间
-            process.waiting_time = self.current_time - process.arrival_time
-            
-            # 执行进程
-            self.current_time += process.burst_time
-            
-            # 计算完成时间和周转时间
-            process.completion_time = self.current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            
-            process.state = ProcessState.READY
-            self.completed_processes.append(process)
-            remaining_processes.remove(process) 
\ No newline at end of file
+    def reset_ready(self):
+        # 就绪进程按响应比组织，并列时选择先出现的进程
+        self.ready_queue = ResponseRatioTournament()
+    
+    def add_ready(self, i):
+        self.ready_queue.insert(i, self.arrival[i], self.burst[i], self.current_time)
+    
+    def pick_next(self):
+        return self.ready_queue.pop_max(self.current_time)
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
\ No newline at end of file
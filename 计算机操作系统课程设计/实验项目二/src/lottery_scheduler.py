@@ -0,0 +1,100 @@
+import random
+from share_scheduler import ProportionalShareScheduler
+
+class TicketTree:
+    """按槽位保存票数的树状数组(Fenwick tree)，加入、修改、按中奖号码查找都是O(log n)"""
+    
+    def __init__(self):
+        self.capacity = 1
+        self.tree = [0, 0]
+        self.tickets = [0]
+        self.items = [None]
+        self.free_slots = [0]
+        self.total = 0
+    
+    def __len__(self):
+        return self.capacity - len(self.free_slots)
+    
+    def _add(self, slot, delta):
+        k = slot + 1
+        while k <= self.capacity:
+            self.tree[k] += delta
+            k += k & -k
+    
+    def add(self, item, tickets):
+        """加入一项，返回它的槽位"""
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+        self.items[slot] = item
+        self.update(slot, tickets)
+        return slot
+    
+    def update(self, slot, tickets):
+        self._add(slot, tickets - self.tickets[slot])
+        self.total += tickets - self.tickets[slot]
+        self.tickets[slot] = tickets
+    
+    def draw(self, number):
+        """取出号码number（0 <= number < total）所在的一项"""
+        pos = 0
+        step = 1 << (self.capacity.bit_length() - 1)
+        while step:
+            if pos + step <= self.capacity and self.tree[pos + step] <= number:
+                pos += step
+                number -= self.tree[pos]
+            step >>= 1
+        item = self.items[pos]
+        self.update(pos, 0)
+        self.items[pos] = None
+        self.free_slots.append(pos)
+        return item
+    
+    def _grow(self):
+        old_capacity = self.capacity
+        self.capacity *= 2
+        self.tickets.extend([0] * old_capacity)
+        self.items.extend([None] * old_capacity)
+        self.free_slots.extend(range(self.capacity - 1, old_capacity - 1, -1))
+        # O(n)重建树状数组
+        self.tree = [0] + self.tickets
+        for k in range(1, self.capacity + 1):
+            parent = k + (k & -k)
+            if parent <= self.capacity:
+                self.tree[parent] += self.tree[k]
+
+class LotteryScheduler(ProportionalShareScheduler):
+    """彩票调度：按票数随机抽取下一个运行的进程，seed固定时结果可以重现"""
+    
+    def __init__(self, quantum=2, seed=0):
+        super().__init__(quantum)
+        self.seed = seed
+    
+    def get_name(self):
+        return "彩票调度(Lottery)"
+    
+    def reset_ready(self):
+        super().reset_ready()
+        self.pool = TicketTree()
+        self.slot = {}
+        self.rng = random.Random(self.seed)
+    
+    def add_ready(self, i):
+        self.join(i)
+        self.requeue(i)
+    
+    def requeue(self, i):
+        self.slot[i] = self.pool.add(i, self.tickets[i])
+    
+    def pick_next(self):
+        i = self.pool.draw(self.rng.randrange(self.pool.total))
+        del self.slot[i]
+        return i
+    
+    def has_ready(self):
+        return self.pool.total > 0
+    
+    def set_tickets(self, i, tickets):
+        super().set_tickets(i, tickets)
+        if i in self.slot:
+            self.pool.update(self.slot[i], tickets)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import threading
 import tkinter as tk
 from tkinter import ttk
 from process import Process, ProcessState
@@ -6,9 +7,22 @@ from sjf_scheduler import SJFScheduler
 from rr_scheduler import RRScheduler
 from priority_scheduler import PriorityScheduler
 from hrrn_scheduler import HRRNScheduler
+from srtf_scheduler import SRTFScheduler
+from preemptive_priority_scheduler import PreemptivePriorityScheduler
+from mlfq_scheduler import MLFQScheduler
+from cfs_scheduler import CFSScheduler
+from share_scheduler import ProportionalShareScheduler
+from stride_scheduler import StrideScheduler
+from lottery_scheduler import LotteryScheduler
+from workload import Workload
+from stream_cli import SCHEDULERS
+from sweep import sweep, lookup, SweepCache
 from tkinter import filedialog
 import os
 
+# 界面中的MLFQ每隔这么多个基本时间片提升一次，参数扫描使用同样的设置
+MLFQ_BOOST_QUANTA = 10
+
 class ProcessSchedulerGUI:
     def __init__(self, root):
         self.root = root
@@ -20,12 +34,19 @@ class ProcessSchedulerGUI:
         # 默认时间片大小
         self.time_quantum = tk.IntVar(value=2)
         
+        # 参数扫描的结果缓存，进程和参数不变时直接复用
+        self.sweep_cache = SweepCache()
+        self.sweep_thread = None
+        
         # 创建调度器（RR调度器会在选择时动态创建）
         self.schedulers = [
             FCFSScheduler(),
             SJFScheduler(),
             PriorityScheduler(),
-            HRRNScheduler()
+            HRRNScheduler(),
+            SRTFScheduler(),
+            PreemptivePriorityScheduler(),
+            CFSScheduler()
         ]
         
         self.setup_ui()
@@ -73,7 +94,13 @@ class ProcessSchedulerGUI:
                 "最短作业优先(SJF)",
                 "优先级调度(Priority)",
                 "时间片轮转(RR)",
-                "高响应比(HRRN)"
+                "高响应比(HRRN)",
+                "最短剩余时间优先(SRTF)",
+                "抢占式优先级(Preemptive Priority)",
+                "多级反馈队列(MLFQ)",
+                "完全公平调度(CFS, 调度周期=12)",
+                "步长调度(Stride)",
+                "彩票调度(Lottery)"
             ],
             width=20
         )
@@ -86,6 +113,8 @@ class ProcessSchedulerGUI:
         ttk.Button(btn_frame, text="开始调度", command=self.start_scheduling).pack(side=tk.LEFT, padx=2)
         ttk.Button(btn_frame, text="暂停", command=self.pause_scheduling).pack(side=tk.LEFT, padx=2)
         ttk.Button(btn_frame, text="重置", command=self.reset_scheduling).pack(side=tk.LEFT, padx=2)
+        self.sweep_button = ttk.Button(btn_frame, text="参数扫描", command=self.sweep_parameters)
+        self.sweep_button.pack(side=tk.LEFT, padx=2)
         
         # 进程信息表格区域
         table_frame = ttk.LabelFrame(main_frame, text="进程信息", padding="5")
@@ -143,6 +172,15 @@ class ProcessSchedulerGUI:
         # 根据选择的算法获取对应的调度器
         if selected_algorithm == "时间片轮转(RR)":
             scheduler = RRScheduler(time_quantum=self.time_quantum.get())
+        elif selected_algorithm == "步长调度(Stride)":
+            scheduler = StrideScheduler(quantum=self.time_quantum.get())
+        elif selected_algorithm == "彩票调度(Lottery)":
+            scheduler = LotteryScheduler(quantum=self.time_quantum.get())
+        elif selected_algorithm == "多级反馈队列(MLFQ)":
+            # 三级队列，时间片逐级加倍，每10个基本时间片提升一次
+            quantum = self.time_quantum.get()
+            scheduler = MLFQScheduler(quanta=[quantum, 2 * quantum, 4 * quantum],
+                                      boost_interval=MLFQ_BOOST_QUANTA * quantum)
         else:
             scheduler = next(
                 (s for s in self.schedulers if s.get_name() == selected_algorithm), 
@@ -150,20 +188,18 @@ class ProcessSchedulerGUI:
             )
         
         if scheduler:
-            scheduler.schedule(self.processes.copy())
-            self.show_results(scheduler)
+            execution_info = scheduler.schedule(self.processes.copy())
+            self.show_results(scheduler, execution_info)
             
-    def show_results(self, scheduler):
+    def show_results(self, scheduler, execution_info):
         # 在结果开始前添加分隔线
         self.result_text.insert(tk.END, "\n" + "="*50 + "\n\n")
         
         result = f"{scheduler.get_name()}：\n"
         
-        # 获取执行结果
-        execution_info = scheduler.schedule(self.processes.copy())
-        
         # 显示执行顺序
-        if isinstance(scheduler, RRScheduler):
+        # 时间片轮转和抢占式算法中进程会分段执行，按时间段显示
+        if scheduler.time_sliced or scheduler.preemptive:
             result += "执行顺序：\n时间段 进程\n"
             for proc_id, start, end in execution_info:
                 result += f"{start:2d} - {end:2d} {proc_id}\n"
@@ -190,12 +226,108 @@ class ProcessSchedulerGUI:
         # 显示平均时间
         result += f"平均周转时间：{scheduler.get_average_turnaround_time():.2f}\n"
         result += f"平均等待时间：{scheduler.get_average_waiting_time():.2f}\n"
+        result += "等待时间 p50/p95/p99：" + " / ".join(
+            str(scheduler.get_percentile("waiting", q)) for q in (50, 95, 99)) + "\n"
+        result += "响应时间 p50/p95/p99：" + " / ".join(
+            str(scheduler.get_percentile("response", q)) for q in (50, 95, 99)) + "\n"
+        
+        # 按票数分配的调度器：进程存活期间实际获得的处理机份额与按票数应得的份额
+        if isinstance(scheduler, ProportionalShareScheduler):
+            result += "处理机份额（票数：实际 / 目标）：\n"
+            for pid, tickets, actual, target in scheduler.share_report:
+                result += f"{pid} {tickets}：{actual:.1%} / {target:.1%}\n"
         
         # 将结果添加到文本框末尾
         self.result_text.insert(tk.END, result)
         # 自动滚动到最新结果
         self.result_text.see(tk.END)
         
+    def sweep_parameters(self):
+        if not self.processes:
+            tk.messagebox.showwarning("警告", "请先添加进程")
+            return
+        
+        if self.sweep_thread is not None:
+            return
+        
+        # 时间片取与时间片设置框相同的范围，各算法在进程池中并行计算；
+        # 扫描在后台线程中进行，界面定时检查是否完成，计算期间不会失去响应
+        quanta = list(range(1, 11))
+        algorithms = list(SCHEDULERS)
+        workload = Workload.from_processes(self.processes)
+        outcome = {}
+        
+        def run():
+            try:
+                outcome['results'] = sweep(workload, algorithms, quanta, self.sweep_cache,
+                                           boost_quanta=MLFQ_BOOST_QUANTA)
+            except Exception as e:
+                outcome['error'] = e
+        
+        self.sweep_thread = threading.Thread(target=run, daemon=True)
+        self.sweep_thread.start()
+        self.sweep_button.config(state=tk.DISABLED, text="扫描中...")
+        self.root.after(100, self.finish_sweep, outcome, algorithms, quanta)
+        
+    def finish_sweep(self, outcome, algorithms, quanta):
+        if self.sweep_thread.is_alive():
+            self.root.after(100, self.finish_sweep, outcome, algorithms, quanta)
+            return
+        self.sweep_thread = None
+        self.sweep_button.config(state=tk.NORMAL, text="参数扫描")
+        if 'error' in outcome:
+            tk.messagebox.showerror("错误", f"参数扫描出错：{outcome['error']}")
+            return
+        self.show_sweep_results(outcome['results'], algorithms, quanta)
+        
+    def show_sweep_results(self, results, algorithms, quanta):
+        window = tk.Toplevel(self.root)
+        window.title("参数扫描：平均周转时间 / 平均等待时间")
+        
+        # 结果表格，每行一个时间片
+        columns = ['时间片'] + [algorithm.upper() for algorithm in algorithms]
+        table = ttk.Treeview(window, columns=columns, show='headings', height=len(quanta))
+        for col in columns:
+            table.heading(col, text=col)
+            table.column(col, width=90, anchor=tk.CENTER)
+        for quantum in quanta:
+            values = [quantum]
+            for algorithm in algorithms:
+                turnaround, waiting = lookup(results, algorithm, quantum)
+                values.append(f"{turnaround:.2f} / {waiting:.2f}")
+            table.insert('', tk.END, values=values)
+        table.pack(fill=tk.X, padx=5, pady=5)
+        
+        # 平均等待时间随时间片变化的折线图
+        # 右侧留出图例的位置
+        width, height, margin, legend = 720, 300, 50, 100
+        canvas = tk.Canvas(window, width=width, height=height, bg='white')
+        canvas.pack(padx=5, pady=5)
+        waiting = {algorithm: [lookup(results, algorithm, q)[1] for q in quanta] for algorithm in algorithms}
+        top = max(max(values) for values in waiting.values()) or 1
+        
+        def point(k, value):
+            x = margin + k * (width - margin - legend) / max(1, len(quanta) - 1)
+            y = height - margin - value / top * (height - 2 * margin)
+            return x, y
+        
+        canvas.create_line(margin, height - margin, width - legend, height - margin)
+        canvas.create_line(margin, margin, margin, height - margin)
+        canvas.create_text((width - legend + margin) / 2, height - 15, text="时间片")
+        canvas.create_text(margin, margin - 20, text="平均等待时间")
+        canvas.create_text(margin - 10, margin, text=f"{top:.1f}", anchor=tk.E)
+        for k, quantum in enumerate(quanta):
+            x, _ = point(k, 0)
+            canvas.create_text(x, height - margin + 12, text=str(quantum))
+        
+        colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
+        for n, algorithm in enumerate(algorithms):
+            color = colors[n % len(colors)]
+            points = [coord for k, value in enumerate(waiting[algorithm]) for coord in point(k, value)]
+            if len(points) >= 4:
+                canvas.create_line(*points, fill=color, width=2)
+            canvas.create_text(width - legend + 15, margin + 15 * n, text=algorithm.upper(), fill=color, anchor=tk.W)
+        
     def pause_scheduling(self):
         pass
         
@@ -0,0 +1,121 @@
+import math
+
+class RunningStats:
+    """Welford算法在线计算方差，只保存常数个量；均值由累加和给出，与逐个求和的结果一致"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self.running_mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self.running_mean
+        self.running_mean += delta / self.count
+        self.m2 += delta * (value - self.running_mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+    
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+class LogHistogram:
+    """对数分桶的直方图（类似HDR Histogram），用于估计分位数
+    
+    小于 2**precision 的整数各占一个桶；更大的值只保留最高的 precision 个二进制位，
+    同一桶内的值相对误差不超过 2**(1-precision)。桶数只与数值范围的对数有关，与样本数无关。
+    """
+    
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.reset()
+    
+    def reset(self):
+        # (移位数, 保留的高位) -> 样本数
+        self.buckets = {}
+        self.count = 0
+        self.max = 0
+    
+    def add(self, value):
+        value = max(0, math.ceil(value))
+        shift = max(0, value.bit_length() - self.precision)
+        key = (shift, value >> shift)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.max = max(self.max, value)
+    
+    def percentile(self, q):
+        """第q百分位数（0~100），返回所在桶的上界，不超过实际最大值"""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for shift, high in sorted(self.buckets):
+            seen += self.buckets[shift, high]
+            if seen >= rank:
+                return min(((high + 1) << shift) - 1, self.max)
+        return self.max
+
+class MetricsSink:
+    """调度结果的统计汇总，进程完成时由调度器写入
+    
+    对周转时间、等待时间和响应时间（首次运行时间 - 到达时间）分别维护
+    均值、方差和分位数，内存与完成的进程数无关。
+    可以替换为任何提供 reset() 和 record(turnaround, waiting, response) 的对象。
+    """
+    
+    FIELDS = ("turnaround", "waiting", "response")
+    
+    def __init__(self, precision=7):
+        self.stats = {field: RunningStats() for field in self.FIELDS}
+        self.histograms = {field: LogHistogram(precision) for field in self.FIELDS}
+    
+    def reset(self):
+        for field in self.FIELDS:
+            self.stats[field].reset()
+            self.histograms[field].reset()
+    
+    def record(self, turnaround, waiting, response):
+        for field, value in zip(self.FIELDS, (turnaround, waiting, response)):
+            self.stats[field].add(value)
+            self.histograms[field].add(value)
+    
+    @property
+    def count(self):
+        return self.stats["turnaround"].count
+    
+    def mean(self, field):
+        return self.stats[field].mean
+    
+    def stddev(self, field):
+        return self.stats[field].stddev
+    
+    def percentile(self, field, q):
+        return self.histograms[field].percentile(q)
+    
+    def summary(self, percentiles=(50, 95, 99)):
+        """各指标的均值、标准差和分位数"""
+        result = {}
+        for field in self.FIELDS:
+            result[field] = {"mean": self.mean(field), "stddev": self.stddev(field)}
+            for q in percentiles:
+                result[field][f"p{q}"] = self.percentile(field, q)
+        return result
\ No newline at end of file
@@ -0,0 +1,85 @@
+from collections import deque
+from event_scheduler import EventScheduler
+
+class MLFQScheduler(EventScheduler):
+    """多级反馈队列
+    
+    新进程进入最高级队列（第0级），用完本级时间片后降一级，被抢占时留在原级。
+    每级一个双端队列，非空的级别记录在位图中，最低的置位即最高的非空级别，O(1)取得。
+    设置 boost_interval 后，每隔这么长时间把所有进程提升回第0级，防止低级进程饥饿；
+    提升在到期后的第一次调度决策时进行。
+    """
+    
+    # 高级别的进程到达时抢占正在运行的低级别进程
+    preemptive = True
+    time_sliced = True
+    
+    def __init__(self, quanta=(2, 4, 8), boost_interval=None):
+        super().__init__()
+        if not quanta:
+            raise ValueError("至少需要一级队列")
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+    
+    def get_name(self):
+        return f"多级反馈队列(MLFQ, 时间片={'/'.join(str(q) for q in self.quanta)})"
+    
+    def reset_ready(self):
+        self.queues = [deque() for _ in self.quanta]
+        self.bitmap = 0
+        # 不在字典中的进程位于第0级，提升时直接清空字典
+        self.level = {}
+        self.next_boost = self.boost_interval or 0
+    
+    def boost(self):
+        if not self.boost_interval or self.current_time < self.next_boost:
+            return
+        self.next_boost = (self.current_time // self.boost_interval + 1) * self.boost_interval
+        top = self.queues[0]
+        for queue in self.queues[1:]:
+            top.extend(queue)
+            queue.clear()
+        self.bitmap = 1 if top else 0
+        self.level.clear()
+    
+    def push(self, i):
+        level = self.level.get(i, 0)
+        self.queues[level].append(i)
+        self.bitmap |= 1 << level
+    
+    def add_ready(self, i):
+        self.boost()
+        self.push(i)
+    
+    def requeue(self, i):
+        self.boost()
+        self.push(i)
+    
+    def pick_next(self):
+        self.boost()
+        level = (self.bitmap & -self.bitmap).bit_length() - 1
+        queue = self.queues[level]
+        i = queue.popleft()
+        if not queue:
+            self.bitmap &= ~(1 << level)
+        return i
+    
+    def has_ready(self):
+        return self.bitmap != 0
+    
+    def time_slice(self, i):
+        return self.quanta[self.level.get(i, 0)]
+    
+    def should_preempt(self, running):
+        return bool(self.bitmap) and (self.bitmap & -self.bitmap).bit_length() - 1 < self.level.get(running, 0)
+    
+    def preempt_rank(self, running):
+        return self.level.get(running, 0)
+    
+    def slice_finished(self, i, ran, expired):
+        level = self.level.get(i, 0)
+        if expired and level < len(self.quanta) - 1:
+            self.level[i] = level + 1
+    
+    def forget(self, i):
+        self.level.pop(i, None)
\ No newline at end of file
@@ -0,0 +1,28 @@
+import heapq
+from event_scheduler import EventScheduler
+
+class PreemptivePriorityScheduler(EventScheduler):
+    """抢占式优先级调度：到达的进程优先级更高（数值更小）时立即抢占"""
+    
+    preemptive = True
+    
+    def get_name(self):
+        return "抢占式优先级(Preemptive Priority)"
+    
+    def reset_ready(self):
+        self.ready_queue = []
+    
+    def add_ready(self, i):
+        heapq.heappush(self.ready_queue, (self.priority[i], i))
+    
+    def pick_next(self):
+        return heapq.heappop(self.ready_queue)[1]
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
+    
+    def should_preempt(self, running):
+        return self.ready_queue[0][0] < self.priority[running]
+    
+    def preempt_rank(self, running):
+        return self.priority[running]
\ No newline at end of file
@@ -0,0 +1,156 @@
+import argparse
+import heapq
+import math
+import sys
+from abc import abstractmethod
+from event_scheduler import EventScheduler
+from schedulability import total_utilization, rm_admission, edf_admission
+
+class PeriodicTask:
+    """周期任务：每隔period释放一个作业，作业最多执行wcet，须在释放后deadline内完成"""
+    
+    def __init__(self, name, wcet, period, deadline=None, offset=0):
+        if deadline is None:
+            deadline = period
+        if not 0 < wcet <= deadline <= period:
+            raise ValueError(f"任务{name}要求 0 < 执行时间 <= 截止时间 <= 周期")
+        self.name = name
+        self.wcet = wcet
+        self.period = period
+        self.deadline = deadline
+        self.offset = offset
+    
+    @property
+    def utilization(self):
+        return self.wcet / self.period
+
+def hyperperiod(tasks):
+    return math.lcm(*(task.period for task in tasks))
+
+def generate_jobs(tasks, horizon):
+    """按释放时间顺序产生horizon之前释放的作业 (作业名, 释放时间, 执行时间, 任务下标)"""
+    releases = [(task.offset, k, 0) for k, task in enumerate(tasks) if task.offset < horizon]
+    heapq.heapify(releases)
+    while releases:
+        release, k, count = heapq.heappop(releases)
+        task = tasks[k]
+        yield f"{task.name}-{count}", release, task.wcet, k
+        if release + task.period < horizon:
+            heapq.heappush(releases, (release + task.period, k, count + 1))
+
+def read_tasks(filename):
+    """读取任务文件，每行“任务名 执行时间 周期 [截止时间]”"""
+    tasks = []
+    with open(filename, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip() and not line.startswith('#'):
+                name, *values = line.split()
+                tasks.append(PeriodicTask(name, *(int(v) for v in values)))
+    return tasks
+
+class RealTimeScheduler(EventScheduler):
+    """周期任务的抢占式调度
+    
+    把任务展开成作业后交给事件驱动核心，作业的priority列保存所属任务的下标，
+    就绪作业按 key 组织成堆，更紧迫的作业到达时立即抢占。错过截止时间的作业仍会执行完，
+    并记入 deadline_misses。
+    """
+    
+    preemptive = True
+    
+    def __init__(self, tasks):
+        super().__init__()
+        self.tasks = list(tasks)
+        self.deadline_misses = []
+    
+    @abstractmethod
+    def key(self, i):
+        """作业i的优先级，越小越优先"""
+    
+    @abstractmethod
+    def admission(self):
+        """不模拟的可调度性判定，返回(能否调度, 判定依据)"""
+    
+    def run_tasks(self, horizon=None):
+        """模拟到horizon（默认一个超周期）之前释放的所有作业，逐个产生执行段"""
+        if horizon is None:
+            horizon = max(task.offset for task in self.tasks) + hyperperiod(self.tasks)
+        self.deadline_misses = []
+        return self.stream(generate_jobs(self.tasks, horizon))
+    
+    def absolute_deadline(self, i):
+        return self.arrival[i] + self.tasks[self.priority[i]].deadline
+    
+    def record_completion(self, i):
+        deadline = self.absolute_deadline(i)
+        if self.current_time > deadline:
+            self.deadline_misses.append((self.ids[i], self.current_time, deadline))
+        super().record_completion(i)
+    
+    def reset_ready(self):
+        self.ready_queue = []
+    
+    def add_ready(self, i):
+        heapq.heappush(self.ready_queue, (self.key(i), i))
+    
+    def pick_next(self):
+        return heapq.heappop(self.ready_queue)[1]
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
+    
+    def should_preempt(self, running):
+        return self.ready_queue[0][0] < self.key(running)
+    
+    def preempt_rank(self, running):
+        return self.key(running)
+
+class EDFScheduler(RealTimeScheduler):
+    """最早截止时间优先"""
+    
+    def get_name(self):
+        return "最早截止时间优先(EDF)"
+    
+    def key(self, i):
+        # 截止时间相同时先释放的作业优先
+        return self.absolute_deadline(i), i
+    
+    def admission(self):
+        return edf_admission(self.tasks)
+
+class RMScheduler(RealTimeScheduler):
+    """单调速率：周期越短优先级越高"""
+    
+    def get_name(self):
+        return "单调速率(RM)"
+    
+    def key(self, i):
+        k = self.priority[i]
+        return self.tasks[k].period, k, i
+    
+    def admission(self):
+        return rm_admission(self.tasks)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="周期任务集的可调度性判定与模拟")
+    parser.add_argument("file", help="任务文件，每行“任务名 执行时间 周期 [截止时间]”")
+    parser.add_argument("--algorithm", choices=("edf", "rm"), default="edf")
+    parser.add_argument("--simulate", action="store_true", help="同时模拟一个超周期，统计错过截止时间的作业")
+    args = parser.parse_args(argv)
+    
+    tasks = read_tasks(args.file)
+    scheduler = EDFScheduler(tasks) if args.algorithm == "edf" else RMScheduler(tasks)
+    ok, reason = scheduler.admission()
+    print(f"{scheduler.get_name()}：任务数 {len(tasks)}，总利用率 {total_utilization(tasks):.3f}")
+    print(f"{'可以' if ok else '不能'}调度（依据：{reason}）")
+    
+    if args.simulate:
+        for _ in scheduler.run_tasks():
+            pass
+        print(f"模拟作业数：{scheduler.completed_count}，错过截止时间：{len(scheduler.deadline_misses)}")
+        for job, completion, deadline in scheduler.deadline_misses[:10]:
+            print(f"  {job} 完成于 {completion}，截止时间 {deadline}")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,109 @@
+import math
+
+# 周期任务集的可调度性判定，任务需提供 wcet（最坏执行时间）、period（周期）、deadline（相对截止时间）。
+# 都按所有任务在0时刻同时释放（最坏情况）判断，不需要模拟整个超周期。
+
+def total_utilization(tasks):
+    return sum(task.wcet / task.period for task in tasks)
+
+def liu_layland_test(tasks):
+    """RM的利用率上界 U <= n(2^(1/n) - 1)，充分条件，要求截止时间等于周期"""
+    n = len(tasks)
+    return n == 0 or total_utilization(tasks) <= n * (2 ** (1 / n) - 1)
+
+def hyperbolic_test(tasks):
+    """RM的双曲线界 ∏(U_i + 1) <= 2，比利用率上界更紧的充分条件，要求截止时间等于周期"""
+    product = 1.0
+    for task in tasks:
+        product *= task.wcet / task.period + 1
+    return product <= 2
+
+def response_times(tasks):
+    """RM下各任务的最坏响应时间（响应时间分析），超过截止时间的任务记为None
+    
+    任务按周期从短到长排定优先级，R = C_i + Σ ceil(R / T_j) * C_j 迭代到不动点。
+    """
+    order = sorted(range(len(tasks)), key=lambda k: tasks[k].period)
+    result = [None] * len(tasks)
+    for rank, k in enumerate(order):
+        higher = [tasks[j] for j in order[:rank]]
+        task = tasks[k]
+        response = task.wcet + sum(t.wcet for t in higher)
+        while response <= task.deadline:
+            next_response = task.wcet + sum(math.ceil(response / t.period) * t.wcet for t in higher)
+            if next_response == response:
+                result[k] = response
+                break
+            response = next_response
+    return result
+
+def rm_admission(tasks):
+    """依次尝试利用率上界、双曲线界和响应时间分析，返回(能否调度, 判定依据)"""
+    if total_utilization(tasks) > 1:
+        return False, "利用率超过1"
+    if all(task.deadline == task.period for task in tasks):
+        if liu_layland_test(tasks):
+            return True, "利用率上界"
+        if hyperbolic_test(tasks):
+            return True, "双曲线界"
+    if all(r is not None for r in response_times(tasks)):
+        return True, "响应时间分析"
+    return False, "响应时间分析"
+
+def demand_bound(tasks, t):
+    """区间[0, t]内释放且截止时间不晚于t的作业的执行时间之和"""
+    return sum((math.floor((t - task.deadline) / task.period) + 1) * task.wcet
+               for task in tasks if t >= task.deadline)
+
+def busy_period(tasks):
+    """同时释放后处理机第一次空闲的时刻，要求利用率不超过1"""
+    length = sum(task.wcet for task in tasks)
+    while True:
+        next_length = sum(math.ceil(length / task.period) * task.wcet for task in tasks)
+        if next_length == length:
+            return length
+        length = next_length
+
+def last_deadline_before(tasks, t, inclusive=False):
+    """早于t（inclusive为True时不晚于t）的最晚绝对截止时间，没有时返回None"""
+    latest = None
+    for task in tasks:
+        if t > task.deadline or (inclusive and t == task.deadline):
+            if inclusive:
+                k = math.floor((t - task.deadline) / task.period)
+            else:
+                k = math.ceil((t - task.deadline) / task.period) - 1
+            deadline = k * task.period + task.deadline
+            if latest is None or deadline > latest:
+                latest = deadline
+    return latest
+
+def edf_admission(tasks):
+    """EDF的处理机需求判定，返回(能否调度, 判定依据)
+    
+    截止时间都等于周期时 U <= 1 即为充要条件；否则用QPA（Zhang & Burns）检查需求函数，
+    从检查区间的上界开始，每次跳到需求值或前一个截止时间，只访问少数几个截止时间点。
+    """
+    utilization = total_utilization(tasks)
+    if utilization > 1:
+        return False, "利用率超过1"
+    if all(task.deadline == task.period for task in tasks):
+        return True, "利用率不超过1"
+    
+    # 检查区间取同步忙碌期和La中较小者
+    limit = busy_period(tasks)
+    if utilization < 1:
+        la = max(max(task.deadline for task in tasks),
+                 sum((task.period - task.deadline) * task.wcet / task.period for task in tasks) / (1 - utilization))
+        limit = min(limit, la)
+    
+    min_deadline = min(task.deadline for task in tasks)
+    t = last_deadline_before(tasks, limit, inclusive=True)
+    while t is not None:
+        demand = demand_bound(tasks, t)
+        if demand > t:
+            return False, "处理机需求分析"
+        if demand <= min_deadline:
+            break
+        t = demand if demand < t else last_deadline_before(tasks, t)
+    return True, "处理机需求分析"
\ No newline at end of file
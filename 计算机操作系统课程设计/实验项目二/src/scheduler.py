@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from metrics import MetricsSink
 
 class Scheduler(ABC):
     def __init__(self):
         self.processes = []
         self.current_time = 0
         self.completed_processes = []
+        # 进程完成时写入的统计汇总，平均值等都从这里读取
+        self.metrics = MetricsSink()
     
     @abstractmethod
     def schedule(self, processes):
@@ -15,13 +18,11 @@ class Scheduler(ABC):
         pass
     
     def get_average_turnaround_time(self):
-        if not self.completed_processes:
-            return 0
-        total = sum(p.turnaround_time for p in self.completed_processes)
-        return total / len(self.completed_processes)
+        return self.metrics.mean("turnaround")
     
     def get_average_waiting_time(self):
-        if not self.completed_processes:
-            return 0
-        total = sum(p.waiting_time for p in self.completed_processes)
-        return total / len(self.completed_processes) 
\ No newline at end of file
+        return self.metrics.mean("waiting")
+    
+    def get_percentile(self, field, q):
+        """field为"turnaround"、"waiting"或"response"，q为百分位（0~100）"""
+        return self.metrics.percentile(field, q) 
\ No newline at end of file
@@ -0,0 +1,63 @@
+from event_scheduler import EventScheduler
+from cfs_scheduler import priority_to_weight
+
+class ProportionalShareScheduler(EventScheduler):
+    """按票数分配处理机的调度器的公共部分
+    
+    票数由 Process.priority 按CFS的nice权重表换算，可以用 set_tickets 修改。
+    份额时钟记录 ∫dt / 当前总票数，进程在存活期间应得的处理机时间就是
+    票数 × 份额时钟的增量；进程完成时把实际份额和目标份额记入 share_report。
+    流式调度时不记录，内存只与同时存在的进程数有关。
+    """
+    
+    time_sliced = True
+    coalesce_slices = True
+    
+    def __init__(self, quantum=2):
+        super().__init__()
+        self.quantum = quantum
+    
+    def reset_ready(self):
+        self.tickets = {}
+        self.total_tickets = 0
+        self.share_clock = 0.0
+        self.clock_time = 0
+        self.joined = {}
+        # (进程ID, 票数, 实际份额, 目标份额)
+        self.share_report = []
+    
+    def advance_share_clock(self):
+        if self.total_tickets:
+            self.share_clock += (self.current_time - self.clock_time) / self.total_tickets
+        self.clock_time = self.current_time
+    
+    def join(self, i):
+        """新到达的进程参与分配，返回它的票数"""
+        self.advance_share_clock()
+        tickets = priority_to_weight(self.priority[i])
+        self.tickets[i] = tickets
+        self.total_tickets += tickets
+        self.joined[i] = self.share_clock
+        return tickets
+    
+    def set_tickets(self, i, tickets):
+        if tickets < 1:
+            raise ValueError("票数至少为1")
+        self.advance_share_clock()
+        self.total_tickets += tickets - self.tickets[i]
+        self.tickets[i] = tickets
+    
+    def time_slice(self, i):
+        return self.quantum
+    
+    def record_completion(self, i):
+        self.advance_share_clock()
+        lifetime = self.current_time - self.arrival[i]
+        if self.keep_completed and self.workload is not None and lifetime > 0:
+            target = self.tickets[i] * (self.share_clock - self.joined[i])
+            self.share_report.append((self.ids[i], self.tickets[i], self.burst[i] / lifetime, target / lifetime))
+        super().record_completion(i)
+    
+    def forget(self, i):
+        self.total_tickets -= self.tickets.pop(i)
+        del self.joined[i]
\ No newline at end of file
@@ -0,0 +1,232 @@
+import heapq
+from event_scheduler import EventScheduler, ARRIVAL, COMPLETION, QUANTUM_EXPIRY
+
+# 周期性负载均衡事件，排在同一时刻的到达和完成事件之后
+BALANCE = 3
+
+class SMPScheduler(EventScheduler):
+    """多处理机调度
+    
+    每个处理机有自己的就绪队列，队列由已有的单处理机调度器充当（FCFS、SJF、Priority、RR等），
+    本地的选取、时间片和抢占规则都沿用它们。mode 决定进程如何分配到处理机：
+      global  所有处理机共用一个就绪队列
+      balance 新进程放到负载最轻的处理机，并每隔 balance_interval 在队列间迁移进程使长度均衡
+      steal   新进程轮流分配，处理机空闲时从最长的队列中窃取进程
+    执行段为 (处理机编号, 进程ID, 开始时间, 结束时间)。
+    """
+    
+    MODES = ("global", "balance", "steal")
+    
+    def __init__(self, policy_factory, cpus=2, mode="global", balance_interval=4):
+        super().__init__()
+        if mode not in self.MODES:
+            raise ValueError(f"未知的多处理机调度方式：{mode}")
+        if cpus < 1:
+            raise ValueError("处理机数至少为1")
+        self.policy_factory = policy_factory
+        self.cpus = cpus
+        self.mode = mode
+        self.balance_interval = balance_interval
+        self.busy_time = [0] * cpus
+        self.migrations = 0
+        self.steals = 0
+    
+    def get_name(self):
+        return f"多处理机({self.mode}, {self.cpus}核, {self.policy_factory().get_name()})"
+    
+    def reset_ready(self):
+        count = 1 if self.mode == "global" else self.cpus
+        self.queues = [self.policy_factory() for _ in range(count)]
+        for policy in self.queues:
+            # 各队列共用调度器的进程列
+            policy.ids = self.ids
+            policy.arrival = self.arrival
+            policy.burst = self.burst
+            policy.priority = self.priority
+            policy.remaining = self.remaining
+            policy.current_time = self.current_time
+            policy.reset_ready()
+        self.queue_length = [0] * count
+        self.running = [None] * self.cpus
+        self.next_cpu = 0
+    
+    def queue_of(self, cpu):
+        return 0 if self.mode == "global" else cpu
+    
+    def enqueue(self, q, i, requeue=False):
+        policy = self.queues[q]
+        policy.current_time = self.current_time
+        if requeue:
+            policy.requeue(i)
+        else:
+            policy.add_ready(i)
+        self.queue_length[q] += 1
+    
+    def dequeue(self, q):
+        policy = self.queues[q]
+        policy.current_time = self.current_time
+        self.queue_length[q] -= 1
+        return policy.pick_next()
+    
+    def load(self, cpu):
+        return self.queue_length[cpu] + (self.running[cpu] is not None)
+    
+    def add_ready(self, i):
+        if self.mode == "global":
+            cpu = 0
+        elif self.mode == "balance":
+            cpu = min(range(self.cpus), key=self.load)
+        else:
+            cpu = self.next_cpu
+            self.next_cpu = (self.next_cpu + 1) % self.cpus
+        self.enqueue(cpu, i)
+    
+    def has_ready(self):
+        return any(self.queue_length)
+    
+    def pick_next(self, cpu=0):
+        """为处理机cpu选取下一个进程，必要时从其他队列窃取"""
+        q = self.queue_of(cpu)
+        if not self.queue_length[q] and self.mode == "steal":
+            victim = max(range(self.cpus), key=self.queue_length.__getitem__)
+            if not self.queue_length[victim]:
+                return None
+            self.steals += 1
+            # 先放入本处理机的队列，由本地策略接管该进程
+            self.enqueue(q, self.migrate(victim))
+        if not self.queue_length[q]:
+            return None
+        return self.dequeue(q)
+    
+    def rebalance(self):
+        """把进程从最长的队列迁到最短的队列，直到长度相差不超过1"""
+        while True:
+            longest = max(range(self.cpus), key=self.load)
+            shortest = min(range(self.cpus), key=self.load)
+            if self.load(longest) - self.load(shortest) <= 1 or not self.queue_length[longest]:
+                return
+            self.enqueue(shortest, self.migrate(longest))
+    
+    def migrate(self, q):
+        """从队列q取出一个进程交给其他处理机，原队列为它保存的数据随之丢弃"""
+        i = self.dequeue(q)
+        self.queues[q].forget(i)
+        return i
+    
+    def get_utilization(self):
+        """各处理机忙碌时间占总时长的比例"""
+        if not self.current_time:
+            return [0.0] * self.cpus
+        return [busy / self.current_time for busy in self.busy_time]
+    
+    def simulate(self, arrivals):
+        self.reset_ready()
+        self.busy_time = [0] * self.cpus
+        self.migrations = 0
+        self.steals = 0
+        running = self.running
+        events = []
+        version = [0] * self.cpus
+        segment_start = [0] * self.cpus
+        accounted = [0] * self.cpus
+        # 进程上次运行的处理机，在别的处理机上再次运行时记一次迁移
+        last_cpu = {}
+        balance_pending = False
+        
+        def push_next_arrival():
+            i = next(arrivals, None)
+            if i is not None:
+                heapq.heappush(events, (self.arrival[i], ARRIVAL, 0, i))
+        
+        def dispatch(cpu):
+            i = self.pick_next(cpu)
+            if i is None:
+                return
+            if last_cpu.get(i, cpu) != cpu:
+                self.migrations += 1
+            last_cpu[i] = cpu
+            running[cpu] = i
+            self.first_start.setdefault(i, self.current_time)
+            segment_start[cpu] = accounted[cpu] = self.current_time
+            run = self.remaining[i]
+            quantum = self.queues[self.queue_of(cpu)].time_slice(i)
+            if quantum is not None and quantum < run:
+                run = quantum
+            version[cpu] += 1
+            kind = COMPLETION if run == self.remaining[i] else QUANTUM_EXPIRY
+            heapq.heappush(events, (self.current_time + run, kind, version[cpu], cpu))
+        
+        def stop(cpu, expired):
+            # 结束处理机cpu上的当前执行段，返回该执行段
+            i = running[cpu]
+            now = self.current_time
+            self.busy_time[cpu] += now - segment_start[cpu]
+            segment = (cpu, self.ids[i], segment_start[cpu], now)
+            running[cpu] = None
+            if self.remaining[i] == 0:
+                del last_cpu[i]
+                self.record_completion(i)
+                self.queues[self.queue_of(cpu)].forget(i)
+            else:
+                q = self.queue_of(cpu)
+                self.queues[q].slice_finished(i, now - segment_start[cpu], expired)
+                self.enqueue(q, i, requeue=True)
+            return segment
+        
+        push_next_arrival()
+        while events:
+            if len(events) == 1 and events[0][1] == BALANCE:
+                # 只剩均衡事件说明所有进程都已完成，不再推进时钟，current_time保持为最后完成的时刻
+                break
+            now = events[0][0]
+            self.current_time = now
+            
+            finished = []
+            while events and events[0][0] == now:
+                _, kind, token, target = heapq.heappop(events)
+                if kind == ARRIVAL:
+                    push_next_arrival()
+                    self.add_ready(target)
+                elif kind == BALANCE:
+                    balance_pending = False
+                    self.rebalance()
+                elif token == version[target]:
+                    finished.append(target)
+            
+            for cpu in range(self.cpus):
+                if running[cpu] is not None:
+                    self.remaining[running[cpu]] -= now - accounted[cpu]
+                    accounted[cpu] = now
+            for cpu in finished:
+                yield stop(cpu, True)
+            
+            for cpu in range(self.cpus):
+                if running[cpu] is None:
+                    dispatch(cpu)
+            
+            # 抢占式策略：就绪队列中有更优先的进程时抢占处理机
+            if self.mode == "global":
+                # 共用队列时抢占运行着最差进程的处理机，直到队首不再优于任何运行中的进程
+                policy = self.queues[0]
+                while policy.preemptive and self.queue_length[0]:
+                    busy = [cpu for cpu in range(self.cpus) if running[cpu] is not None]
+                    if not busy:
+                        break
+                    cpu = max(busy, key=lambda c: policy.preempt_rank(running[c]))
+                    if not policy.should_preempt(running[cpu]):
+                        break
+                    version[cpu] += 1
+                    yield stop(cpu, False)
+                    dispatch(cpu)
+            else:
+                for cpu in range(self.cpus):
+                    policy = self.queues[cpu]
+                    if (running[cpu] is not None and policy.preemptive and self.queue_length[cpu]
+                            and policy.should_preempt(running[cpu])):
+                        version[cpu] += 1
+                        yield stop(cpu, False)
+                        dispatch(cpu)
+            
+            if self.mode == "balance" and not balance_pending and self.has_ready():
+                balance_pending = True
+                heapq.heappush(events, (now + self.balance_interval, BALANCE, 0, 0))
\ No newline at end of file
@@ -0,0 +1,30 @@
+import heapq
+from event_scheduler import EventScheduler
+
+class SRTFScheduler(EventScheduler):
+    """最短剩余时间优先：新进程的运行时间比当前进程的剩余时间更短时抢占"""
+    
+    preemptive = True
+    
+    def get_name(self):
+        return "最短剩余时间优先(SRTF)"
+    
+    def reset_ready(self):
+        # 就绪进程的剩余时间在等待期间不变，入队时的键一直有效
+        self.ready_queue = []
+    
+    def add_ready(self, i):
+        heapq.heappush(self.ready_queue, (self.remaining[i], i))
+    
+    def pick_next(self):
+        return heapq.heappop(self.ready_queue)[1]
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
+    
+    def should_preempt(self, running):
+        # 剩余时间相同时不抢占，避免无谓的切换
+        return self.ready_queue[0][0] < self.remaining[running]
+    
+    def preempt_rank(self, running):
+        return self.remaining[running]
\ No newline at end of file
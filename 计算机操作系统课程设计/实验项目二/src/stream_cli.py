@@ -0,0 +1,77 @@
+import argparse
+import sys
+from workload import read_arrivals
+from fcfs_scheduler import FCFSScheduler
+from sjf_scheduler import SJFScheduler
+from priority_scheduler import PriorityScheduler
+from hrrn_scheduler import HRRNScheduler
+from rr_scheduler import RRScheduler
+from srtf_scheduler import SRTFScheduler
+from preemptive_priority_scheduler import PreemptivePriorityScheduler
+from mlfq_scheduler import MLFQScheduler
+from cfs_scheduler import CFSScheduler
+from stride_scheduler import StrideScheduler
+from lottery_scheduler import LotteryScheduler
+from smp_scheduler import SMPScheduler
+
+SCHEDULERS = {
+    "fcfs": FCFSScheduler,
+    "sjf": SJFScheduler,
+    "priority": PriorityScheduler,
+    "hrrn": HRRNScheduler,
+    "rr": RRScheduler,
+    "srtf": SRTFScheduler,
+    "ppriority": PreemptivePriorityScheduler,
+    "mlfq": MLFQScheduler,
+    "cfs": CFSScheduler,
+    "stride": StrideScheduler,
+    "lottery": LotteryScheduler,
+}
+
+def make_scheduler(name, time_quantum=2, levels=3, boost_interval=None):
+    if name == "rr":
+        return RRScheduler(time_quantum=time_quantum)
+    if name == "mlfq":
+        # 时间片从time_quantum开始逐级加倍
+        return MLFQScheduler([time_quantum << level for level in range(levels)], boost_interval)
+    if name in ("stride", "lottery"):
+        return SCHEDULERS[name](time_quantum)
+    return SCHEDULERS[name]()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="不启动界面，以流的方式调度进程文件")
+    parser.add_argument("file", help="进程文件，每行“进程ID 到达时间 运行时间 优先级”，按到达时间排序")
+    parser.add_argument("--algorithm", choices=sorted(SCHEDULERS), default="fcfs")
+    parser.add_argument("--quantum", type=int, default=2, help="RR、Stride、Lottery的时间片大小，MLFQ第0级的时间片大小")
+    parser.add_argument("--levels", type=int, default=3, help="MLFQ的队列级数")
+    parser.add_argument("--boost", type=int, help="MLFQ把所有进程提升到第0级的周期，默认不提升")
+    parser.add_argument("--quiet", action="store_true", help="只输出统计结果，不输出执行段")
+    parser.add_argument("--cpus", type=int, default=1, help="处理机数，大于1时按多处理机调度")
+    parser.add_argument("--smp-mode", choices=SMPScheduler.MODES, default="global",
+                        help="多处理机的就绪队列组织方式")
+    args = parser.parse_args(argv)
+    
+    if args.cpus > 1:
+        scheduler = SMPScheduler(lambda: make_scheduler(args.algorithm, args.quantum, args.levels, args.boost),
+                                 args.cpus, args.smp_mode)
+    else:
+        scheduler = make_scheduler(args.algorithm, args.quantum, args.levels, args.boost)
+    out = sys.stdout
+    for segment in scheduler.stream(read_arrivals(args.file)):
+        if not args.quiet:
+            out.write(" ".join(str(v) for v in segment) + "\n")
+    
+    print(f"{scheduler.get_name()}：完成进程数 {scheduler.completed_count}")
+    if args.cpus > 1:
+        utilization = "，".join(f"CPU{cpu} {u:.1%}" for cpu, u in enumerate(scheduler.get_utilization()))
+        print(f"处理机利用率：{utilization}")
+        print(f"迁移次数：{scheduler.migrations}，窃取次数：{scheduler.steals}")
+    print(f"平均周转时间：{scheduler.get_average_turnaround_time():.2f}")
+    print(f"平均等待时间：{scheduler.get_average_waiting_time():.2f}")
+    for field, label in (("waiting", "等待时间"), ("response", "响应时间")):
+        values = "，".join(f"p{q} {scheduler.get_percentile(field, q)}" for q in (50, 95, 99))
+        print(f"{label}分位数：{values}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
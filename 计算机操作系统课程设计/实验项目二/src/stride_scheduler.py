@@ -0,0 +1,46 @@
+import heapq
+from share_scheduler import ProportionalShareScheduler
+
+# 步长 = STRIDE1 / 票数，每运行一个时间单位行程值增加一个步长
+STRIDE1 = 1 << 20
+
+class StrideScheduler(ProportionalShareScheduler):
+    """步长调度：总是运行行程值(pass)最小的进程，就绪进程按 (行程值, 入队序号) 组织成堆"""
+    
+    def get_name(self):
+        return "步长调度(Stride)"
+    
+    def reset_ready(self):
+        super().reset_ready()
+        self.ready_queue = []
+        self.pass_value = {}
+        self.sequence = 0
+        # 最近被选中的行程值，新进程从这里开始，不会因为到达晚而独占处理机
+        self.global_pass = 0
+    
+    def push(self, i):
+        heapq.heappush(self.ready_queue, (self.pass_value[i], self.sequence, i))
+        self.sequence += 1
+    
+    def add_ready(self, i):
+        self.join(i)
+        self.pass_value[i] = self.global_pass
+        self.push(i)
+    
+    def requeue(self, i):
+        self.push(i)
+    
+    def pick_next(self):
+        pass_value, _, i = heapq.heappop(self.ready_queue)
+        self.global_pass = max(self.global_pass, pass_value)
+        return i
+    
+    def has_ready(self):
+        return bool(self.ready_queue)
+    
+    def slice_finished(self, i, ran, expired):
+        self.pass_value[i] += ran * (STRIDE1 // self.tickets[i])
+    
+    def forget(self, i):
+        super().forget(i)
+        del self.pass_value[i]
\ No newline at end of file
@@ -0,0 +1,133 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from workload import Workload
+from stream_cli import SCHEDULERS, make_scheduler
+
+# 结果随时间片变化的算法，其余算法每个进程集合只需计算一次
+QUANTUM_ALGORITHMS = ("rr", "mlfq", "stride", "lottery")
+
+def workload_key(workload):
+    """进程集合内容的摘要"""
+    digest = hashlib.sha256()
+    digest.update("\0".join(str(pid) for pid in workload.ids).encode('utf-8'))
+    for column in (workload.arrival, workload.burst, workload.priority):
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+def cache_key(base_key, algorithm, quantum, boost_interval=None):
+    text = f"{base_key}|{algorithm}|{quantum}"
+    if boost_interval is not None:
+        text += f"|{boost_interval}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class SweepCache:
+    """以(进程集合, 算法, 时间片)的摘要为键的结果缓存，给出文件名时保存到JSON文件"""
+    
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.results = {}
+        if filename and os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as file:
+                self.results = {key: tuple(value) for key, value in json.load(file).items()}
+    
+    def get(self, key):
+        return self.results.get(key)
+    
+    def put(self, key, result):
+        self.results[key] = result
+    
+    def save(self):
+        if self.filename:
+            with open(self.filename, 'w', encoding='utf-8') as file:
+                json.dump(self.results, file)
+
+# 工作进程中的进程集合，由初始化函数设置一次
+_workload = None
+
+def _init_worker(workload):
+    global _workload
+    _workload = workload
+
+def _evaluate(job):
+    algorithm, quantum, boost_interval = job
+    scheduler = make_scheduler(algorithm, quantum or 2, boost_interval=boost_interval)
+    # 只统计结果，不保存执行段
+    deque(scheduler.run(_workload), maxlen=0)
+    return scheduler.get_average_turnaround_time(), scheduler.get_average_waiting_time()
+
+def sweep(workload, algorithms, quanta, cache=None, max_workers=None, boost_quanta=None):
+    """在进程池中计算各算法在各时间片下的平均周转时间和平均等待时间
+    
+    返回 {(算法, 时间片): (平均周转时间, 平均等待时间)}，与时间片无关的算法时间片记为None。
+    给出 boost_quanta 时MLFQ每隔这么多个时间片提升一次，否则不提升。
+    """
+    if cache is None:
+        cache = SweepCache()
+    base_key = workload_key(workload)
+    results = {}
+    pending = []
+    for algorithm in algorithms:
+        for quantum in (quanta if algorithm in QUANTUM_ALGORITHMS else [None]):
+            boost_interval = boost_quanta * quantum if algorithm == "mlfq" and boost_quanta else None
+            key = cache_key(base_key, algorithm, quantum, boost_interval)
+            result = cache.get(key)
+            if result is None:
+                pending.append(((algorithm, quantum, boost_interval), key))
+            else:
+                results[algorithm, quantum] = result
+    
+    if pending:
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(workload,)) as pool:
+            jobs = [job for job, _ in pending]
+            for (job, key), result in zip(pending, pool.map(_evaluate, jobs)):
+                results[job[:2]] = result
+                cache.put(key, result)
+        cache.save()
+    return results
+
+def lookup(results, algorithm, quantum):
+    """取某算法在某时间片下的结果，与时间片无关的算法直接返回其唯一结果"""
+    return results[algorithm, quantum if algorithm in QUANTUM_ALGORITHMS else None]
+
+def parse_quanta(text):
+    """解析“1-10”或“1,2,4,8”形式的时间片列表"""
+    if '-' in text:
+        low, high = map(int, text.split('-'))
+        return list(range(low, high + 1))
+    return [int(v) for v in text.split(',')]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="比较各调度算法在不同时间片下的平均周转时间和平均等待时间")
+    parser.add_argument("file", help="进程文件，每行“进程ID 到达时间 运行时间 优先级”")
+    parser.add_argument("--algorithms", default=",".join(SCHEDULERS), help="逗号分隔的算法名")
+    parser.add_argument("--quanta", default="1-10", help="时间片范围，如1-10或1,2,4,8")
+    parser.add_argument("--cache", help="结果缓存文件")
+    parser.add_argument("--workers", type=int, help="进程池大小，默认为CPU核数")
+    parser.add_argument("--boost-quanta", type=int, help="MLFQ每隔多少个时间片提升一次，默认不提升")
+    args = parser.parse_args(argv)
+    
+    algorithms = args.algorithms.split(',')
+    for algorithm in algorithms:
+        if algorithm not in SCHEDULERS:
+            parser.error(f"未知的算法：{algorithm}")
+    quanta = parse_quanta(args.quanta)
+    
+    results = sweep(Workload.from_file(args.file), algorithms, quanta, SweepCache(args.cache), args.workers,
+                    args.boost_quanta)
+    print("时间片 " + " ".join(f"{algorithm:>15}" for algorithm in algorithms))
+    for quantum in quanta:
+        cells = []
+        for algorithm in algorithms:
+            turnaround, waiting = lookup(results, algorithm, quantum)
+            cells.append(f"{turnaround:7.2f}/{waiting:7.2f}")
+        print(f"{quantum:6d} " + " ".join(cells))
+    print("表中为 平均周转时间/平均等待时间")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,120 @@
+from array import array
+
+def read_arrivals(filename):
+    """逐行读取进程文件，依次产生 (进程ID, 到达时间, 运行时间, 优先级)，不把整个文件读入内存"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                pid, arrival_time, burst_time, priority = line.split()
+                yield pid, int(arrival_time), int(burst_time), int(priority)
+
+class ProcessView:
+    """Workload中一个进程的只读视图，属性名与Process一致"""
+    
+    __slots__ = ('workload', 'index')
+    
+    def __init__(self, workload, index):
+        self.workload = workload
+        self.index = index
+    
+    @property
+    def id(self):
+        return self.workload.ids[self.index]
+    
+    @property
+    def arrival_time(self):
+        return self.workload.arrival[self.index]
+    
+    @property
+    def burst_time(self):
+        return self.workload.burst[self.index]
+    
+    @property
+    def priority(self):
+        return self.workload.priority[self.index]
+    
+    @property
+    def completion_time(self):
+        return self.workload.completion[self.index]
+    
+    @property
+    def turnaround_time(self):
+        return self.workload.turnaround[self.index]
+    
+    @property
+    def waiting_time(self):
+        return self.workload.waiting[self.index]
+
+class WorkloadSelection:
+    """按给定下标顺序访问Workload中的进程，不为每个进程创建对象"""
+    
+    def __init__(self, workload, indices):
+        self.workload = workload
+        self.indices = indices
+    
+    def __len__(self):
+        return len(self.indices)
+    
+    def __getitem__(self, k):
+        return ProcessView(self.workload, self.indices[k])
+    
+    def __iter__(self):
+        for i in self.indices:
+            yield ProcessView(self.workload, i)
+
+class Workload:
+    """按列保存的进程集合
+    
+    进程编号、到达时间、运行时间、优先级以及调度结果各占一列，整数列使用array('q')，
+    每个进程只占几十个字节；调度器直接读写这些列，进程用下标表示。
+    """
+    
+    def __init__(self, ids=(), arrival_times=(), burst_times=(), priorities=()):
+        self.ids = list(ids)
+        self.arrival = array('q', arrival_times)
+        self.burst = array('q', burst_times)
+        self.priority = array('q', priorities)
+        if not len(self.ids) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("各列长度不一致")
+        self.reset_results()
+    
+    @classmethod
+    def from_processes(cls, processes):
+        return cls([p.id for p in processes],
+                   [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes],
+                   [p.priority for p in processes])
+    
+    @classmethod
+    def from_file(cls, filename):
+        """读取“进程ID 到达时间 运行时间 优先级”格式的进程文件"""
+        workload = cls()
+        for row in read_arrivals(filename):
+            workload.append(*row)
+        workload.reset_results()
+        return workload
+    
+    def append(self, id, arrival_time, burst_time, priority):
+        self.ids.append(id)
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority)
+    
+    def reset_results(self):
+        """按当前进程数重新分配结果列"""
+        zeros = bytes(self.arrival.itemsize * len(self.ids))
+        self.completion = array('q', zeros)
+        self.turnaround = array('q', zeros)
+        self.waiting = array('q', zeros)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __getitem__(self, i):
+        return ProcessView(self, i)
+    
+    def __iter__(self):
+        return iter(WorkloadSelection(self, range(len(self.ids))))
+    
+    def select(self, indices):
+        return WorkloadSelection(self, indices)
\ No newline at end of file